@@ -0,0 +1,19 @@
+#----------------------------------------------------------------
+# Generated CMake target import file for configuration "Release".
+#----------------------------------------------------------------
+
+# Commands may need to know the format version.
+set(CMAKE_IMPORT_FILE_VERSION 1)
+
+# Import target "westwood::westwood_static" for configuration "Release"
+set_property(TARGET westwood::westwood_static APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(westwood::westwood_static PROPERTIES
+  IMPORTED_LINK_INTERFACE_LANGUAGES_RELEASE "CXX"
+  IMPORTED_LOCATION_RELEASE "${_IMPORT_PREFIX}/lib/libwestwood.a"
+  )
+
+list(APPEND _cmake_import_check_targets westwood::westwood_static )
+list(APPEND _cmake_import_check_files_for_westwood::westwood_static "${_IMPORT_PREFIX}/lib/libwestwood.a" )
+
+# Commands beyond this point should not need to know the version.
+set(CMAKE_IMPORT_FILE_VERSION)
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/aud-tool.dir/aud-tool/main.cpp.o"
+  "CMakeFiles/aud-tool.dir/aud-tool/main.cpp.o.d"
+  "aud-tool"
+  "aud-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/aud-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/blowfish-tool.dir/blowfish-tool/main.cpp.o"
+  "CMakeFiles/blowfish-tool.dir/blowfish-tool/main.cpp.o.d"
+  "blowfish-tool"
+  "blowfish-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/blowfish-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
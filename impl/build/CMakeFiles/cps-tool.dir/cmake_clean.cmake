@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/cps-tool.dir/cps-tool/main.cpp.o"
+  "CMakeFiles/cps-tool.dir/cps-tool/main.cpp.o.d"
+  "cps-tool"
+  "cps-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/cps-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fnt-tool.dir/fnt-tool/main.cpp.o"
+  "CMakeFiles/fnt-tool.dir/fnt-tool/main.cpp.o.d"
+  "fnt-tool"
+  "fnt-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/fnt-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/lcw-tool.dir/lcw-tool/main.cpp.o"
+  "CMakeFiles/lcw-tool.dir/lcw-tool/main.cpp.o.d"
+  "lcw-tool"
+  "lcw-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/lcw-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
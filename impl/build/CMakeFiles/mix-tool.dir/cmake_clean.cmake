@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/mix-tool.dir/mix-tool/main.cpp.o"
+  "CMakeFiles/mix-tool.dir/mix-tool/main.cpp.o.d"
+  "mix-tool"
+  "mix-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/mix-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
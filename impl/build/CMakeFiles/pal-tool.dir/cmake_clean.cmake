@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/pal-tool.dir/pal-tool/main.cpp.o"
+  "CMakeFiles/pal-tool.dir/pal-tool/main.cpp.o.d"
+  "pal-tool"
+  "pal-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/pal-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
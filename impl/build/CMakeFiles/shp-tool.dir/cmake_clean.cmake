@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/shp-tool.dir/shp-tool/main.cpp.o"
+  "CMakeFiles/shp-tool.dir/shp-tool/main.cpp.o.d"
+  "shp-tool"
+  "shp-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/shp-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/tmp-tool.dir/tmp-tool/main.cpp.o"
+  "CMakeFiles/tmp-tool.dir/tmp-tool/main.cpp.o.d"
+  "tmp-tool"
+  "tmp-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/tmp-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/vqa-tool.dir/vqa-tool/main.cpp.o"
+  "CMakeFiles/vqa-tool.dir/vqa-tool/main.cpp.o.d"
+  "vqa-tool"
+  "vqa-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/vqa-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
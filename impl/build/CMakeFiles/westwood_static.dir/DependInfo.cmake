@@ -0,0 +1,32 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/tmp/wwsrc/libwestwood/src/aud.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/aud.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/aud.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/blowfish.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/blowfish.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/blowfish.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/cps.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/cps.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/cps.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/error.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/error.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/error.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/fnt.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/fnt.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/fnt.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/io.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/io.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/io.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/lcw.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/lcw.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/lcw.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/mix.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/mix.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/mix.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/pal.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/pal.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/pal.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/png.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/png.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/png.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/shp.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/shp.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/shp.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/tmp.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/tmp.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/tmp.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/vqa.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/vqa.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/vqa.cpp.o.d"
+  "/tmp/wwsrc/libwestwood/src/wsa.cpp" "CMakeFiles/westwood_static.dir/libwestwood/src/wsa.cpp.o" "gcc" "CMakeFiles/westwood_static.dir/libwestwood/src/wsa.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,37 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/westwood_static.dir/libwestwood/src/aud.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/aud.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/blowfish.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/blowfish.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/cps.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/cps.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/error.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/error.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/fnt.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/fnt.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/io.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/io.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/lcw.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/lcw.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/mix.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/mix.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/pal.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/pal.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/png.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/png.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/shp.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/shp.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/tmp.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/tmp.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/vqa.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/vqa.cpp.o.d"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/wsa.cpp.o"
+  "CMakeFiles/westwood_static.dir/libwestwood/src/wsa.cpp.o.d"
+  "libwestwood.a"
+  "libwestwood.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/westwood_static.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
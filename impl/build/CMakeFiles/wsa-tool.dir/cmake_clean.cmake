@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/wsa-tool.dir/wsa-tool/main.cpp.o"
+  "CMakeFiles/wsa-tool.dir/wsa-tool/main.cpp.o.d"
+  "wsa-tool"
+  "wsa-tool.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/wsa-tool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -2,15 +2,25 @@
 Pytest configuration and shared fixtures for Westwood tool tests.
 """
 
+import contextlib
+import functools
+import hashlib
+import json
+import mmap
 import os
 import subprocess
-import tempfile
+import zlib
 import shutil
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional
 
 import pytest
 
+try:
+    import orjson  # Optional: faster JSON parsing straight from bytes
+except ImportError:
+    orjson = None
+
 
 # === Path Configuration ===
 
@@ -21,185 +31,213 @@ EXTRACTED_DIR = Path(__file__).parent / "testdata" / "extracted"
 GOLDEN_DIR = Path(__file__).parent / "testdata" / "golden"
 
 
+# === Pytest Configuration ===
+
+def pytest_configure(config):
+    """Register custom markers."""
+    # Used by pytest-xdist --dist=loadgroup; harmless when xdist is absent
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one pytest-xdist worker",
+    )
+
+
 # === Tool Path Fixtures ===
 
-@pytest.fixture
+@functools.lru_cache(maxsize=None)
+def tool_path(name: str) -> Optional[Path]:
+    """
+    Absolute path to a tool, resolved once per session.
+
+    Prefers the build directory and falls back to an installed tool on
+    PATH. Returns None if neither exists.
+    """
+    path = BUILD_DIR / name
+    if path.exists():
+        return path.resolve()
+    found = shutil.which(name)
+    return Path(found).resolve() if found else None
+
+
+@pytest.fixture(scope="session")
 def mix_tool() -> Path:
     """Path to mix-tool executable."""
-    path = BUILD_DIR / "mix-tool"
-    if not path.exists():
+    path = tool_path("mix-tool")
+    if path is None:
         pytest.skip("mix-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aud_tool() -> Path:
     """Path to aud-tool executable."""
-    path = BUILD_DIR / "aud-tool"
-    if not path.exists():
+    path = tool_path("aud-tool")
+    if path is None:
         pytest.skip("aud-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def shp_tool() -> Path:
     """Path to shp-tool executable."""
-    path = BUILD_DIR / "shp-tool"
-    if not path.exists():
+    path = tool_path("shp-tool")
+    if path is None:
         pytest.skip("shp-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pal_tool() -> Path:
     """Path to pal-tool executable."""
-    path = BUILD_DIR / "pal-tool"
-    if not path.exists():
+    path = tool_path("pal-tool")
+    if path is None:
         pytest.skip("pal-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wsa_tool() -> Path:
     """Path to wsa-tool executable."""
-    path = BUILD_DIR / "wsa-tool"
-    if not path.exists():
+    path = tool_path("wsa-tool")
+    if path is None:
         pytest.skip("wsa-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tmp_tool() -> Path:
     """Path to tmp-tool executable."""
-    path = BUILD_DIR / "tmp-tool"
-    if not path.exists():
+    path = tool_path("tmp-tool")
+    if path is None:
         pytest.skip("tmp-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fnt_tool() -> Path:
     """Path to fnt-tool executable."""
-    path = BUILD_DIR / "fnt-tool"
-    if not path.exists():
+    path = tool_path("fnt-tool")
+    if path is None:
         pytest.skip("fnt-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cps_tool() -> Path:
     """Path to cps-tool executable."""
-    path = BUILD_DIR / "cps-tool"
-    if not path.exists():
+    path = tool_path("cps-tool")
+    if path is None:
         pytest.skip("cps-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lcw_tool() -> Path:
     """Path to lcw-tool executable."""
-    path = BUILD_DIR / "lcw-tool"
-    if not path.exists():
+    path = tool_path("lcw-tool")
+    if path is None:
         pytest.skip("lcw-tool not built")
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vqa_tool() -> Path:
     """Path to vqa-tool executable."""
-    path = BUILD_DIR / "vqa-tool"
-    if not path.exists():
+    path = tool_path("vqa-tool")
+    if path is None:
         pytest.skip("vqa-tool not built")
     return path
 
 
 # === Test Data Fixtures ===
 
-@pytest.fixture
-def testdata_mix_files() -> list[Path]:
-    """List of MIX files in testdata."""
+@functools.lru_cache(maxsize=None)
+def _scan_testdata(root: Path, mtime_ns: int) -> dict[str, tuple[Path, ...]]:
+    """Walk root once and group its files by lower-case extension.
+
+    mtime_ns is only part of the cache key, so touching the root directory
+    invalidates the previous scan.
+    """
+    found: dict[str, list[Path]] = {}
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(Path(entry.path))
+                else:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    found.setdefault(ext, []).append(Path(entry.path))
+    return {ext: tuple(sorted(paths)) for ext, paths in found.items()}
+
+
+def find_testdata(ext: str, *roots: Path) -> tuple[Path, ...]:
+    """Files with extension ext (any case) under each existing root."""
+    files: list[Path] = []
+    for root in roots:
+        try:
+            mtime_ns = os.stat(root).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        files += _scan_testdata(root, mtime_ns).get(ext, ())
+    return tuple(files)
+
+
+@pytest.fixture(scope="session")
+def testdata_mix_files() -> tuple[Path, ...]:
+    """MIX files in testdata."""
     mix_dir = TESTDATA_DIR / "mix"
     if not mix_dir.exists():
         pytest.skip("testdata/mix directory not found")
-    return list(mix_dir.glob("*.mix"))
+    return tuple(sorted(mix_dir.glob("*.mix")))
 
 
-@pytest.fixture
-def testdata_vqa_files() -> list[Path]:
-    """List of VQA files in testdata."""
-    vqa_files = list(TESTDATA_DIR.glob("**/*.VQA"))
-    vqa_files += list(TESTDATA_DIR.glob("**/*.vqa"))
-    return vqa_files
+@pytest.fixture(scope="session")
+def testdata_vqa_files() -> tuple[Path, ...]:
+    """VQA files in testdata."""
+    return find_testdata(".vqa", TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_aud_files() -> list[Path]:
-    """List of AUD files in testdata (extracted or found)."""
-    aud_files = list(EXTRACTED_DIR.glob("**/*.aud"))
-    aud_files += list(EXTRACTED_DIR.glob("**/*.AUD"))
-    aud_files += list(TESTDATA_DIR.glob("**/*.aud"))
-    aud_files += list(TESTDATA_DIR.glob("**/*.AUD"))
-    return aud_files
+@pytest.fixture(scope="session")
+def testdata_aud_files() -> tuple[Path, ...]:
+    """AUD files in testdata (extracted or found)."""
+    return find_testdata(".aud", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_shp_files() -> list[Path]:
-    """List of SHP files in testdata (extracted or found)."""
-    shp_files = list(EXTRACTED_DIR.glob("**/*.shp"))
-    shp_files += list(EXTRACTED_DIR.glob("**/*.SHP"))
-    shp_files += list(TESTDATA_DIR.glob("**/*.shp"))
-    shp_files += list(TESTDATA_DIR.glob("**/*.SHP"))
-    return shp_files
+@pytest.fixture(scope="session")
+def testdata_shp_files() -> tuple[Path, ...]:
+    """SHP files in testdata (extracted or found)."""
+    return find_testdata(".shp", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_pal_files() -> list[Path]:
-    """List of PAL files in testdata (extracted or found)."""
-    pal_files = list(EXTRACTED_DIR.glob("**/*.pal"))
-    pal_files += list(EXTRACTED_DIR.glob("**/*.PAL"))
-    pal_files += list(TESTDATA_DIR.glob("**/*.pal"))
-    pal_files += list(TESTDATA_DIR.glob("**/*.PAL"))
-    return pal_files
+@pytest.fixture(scope="session")
+def testdata_pal_files() -> tuple[Path, ...]:
+    """PAL files in testdata (extracted or found)."""
+    return find_testdata(".pal", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_wsa_files() -> list[Path]:
-    """List of WSA files in testdata (extracted or found)."""
-    wsa_files = list(EXTRACTED_DIR.glob("**/*.wsa"))
-    wsa_files += list(EXTRACTED_DIR.glob("**/*.WSA"))
-    wsa_files += list(TESTDATA_DIR.glob("**/*.wsa"))
-    wsa_files += list(TESTDATA_DIR.glob("**/*.WSA"))
-    return wsa_files
+@pytest.fixture(scope="session")
+def testdata_wsa_files() -> tuple[Path, ...]:
+    """WSA files in testdata (extracted or found)."""
+    return find_testdata(".wsa", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_tmp_files() -> list[Path]:
-    """List of TMP files in testdata (extracted or found)."""
-    tmp_files = list(EXTRACTED_DIR.glob("**/*.tmp"))
-    tmp_files += list(EXTRACTED_DIR.glob("**/*.TMP"))
-    tmp_files += list(TESTDATA_DIR.glob("**/*.tmp"))
-    tmp_files += list(TESTDATA_DIR.glob("**/*.TMP"))
-    return tmp_files
+@pytest.fixture(scope="session")
+def testdata_tmp_files() -> tuple[Path, ...]:
+    """TMP files in testdata (extracted or found)."""
+    return find_testdata(".tmp", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_fnt_files() -> list[Path]:
-    """List of FNT files in testdata (extracted or found)."""
-    fnt_files = list(EXTRACTED_DIR.glob("**/*.fnt"))
-    fnt_files += list(EXTRACTED_DIR.glob("**/*.FNT"))
-    fnt_files += list(TESTDATA_DIR.glob("**/*.fnt"))
-    fnt_files += list(TESTDATA_DIR.glob("**/*.FNT"))
-    return fnt_files
+@pytest.fixture(scope="session")
+def testdata_fnt_files() -> tuple[Path, ...]:
+    """FNT files in testdata (extracted or found)."""
+    return find_testdata(".fnt", EXTRACTED_DIR, TESTDATA_DIR)
 
 
-@pytest.fixture
-def testdata_cps_files() -> list[Path]:
-    """List of CPS files in testdata (extracted or found)."""
-    cps_files = list(EXTRACTED_DIR.glob("**/*.cps"))
-    cps_files += list(EXTRACTED_DIR.glob("**/*.CPS"))
-    cps_files += list(TESTDATA_DIR.glob("**/*.cps"))
-    cps_files += list(TESTDATA_DIR.glob("**/*.CPS"))
-    return cps_files
+@pytest.fixture(scope="session")
+def testdata_cps_files() -> tuple[Path, ...]:
+    """CPS files in testdata (extracted or found)."""
+    return find_testdata(".cps", EXTRACTED_DIR, TESTDATA_DIR)
 
 
 @pytest.fixture
@@ -208,19 +246,59 @@ def golden_dir() -> Path:
     return GOLDEN_DIR
 
 
+@pytest.fixture(scope="session")
+def first_shp(testdata_shp_files) -> Optional[Path]:
+    """First SHP file in testdata, or None."""
+    return testdata_shp_files[0] if testdata_shp_files else None
+
+
+@pytest.fixture(scope="session")
+def first_pal(testdata_pal_files) -> Optional[Path]:
+    """First PAL file in testdata, or None."""
+    return testdata_pal_files[0] if testdata_pal_files else None
+
+
+@pytest.fixture(scope="session")
+def first_tmp(testdata_tmp_files) -> Optional[Path]:
+    """First TMP file in testdata, or None."""
+    return testdata_tmp_files[0] if testdata_tmp_files else None
+
+
+def palette_sources(files, pal_files, kind: str) -> tuple[Path, Path]:
+    """(pal, file) from the first testdata files, skipping when missing."""
+    if not files:
+        pytest.skip(f"No {kind} files in testdata")
+    if not pal_files:
+        pytest.skip("No PAL files in testdata")
+    return pal_files[0], files[0]
+
+
+@pytest.fixture(scope="session")
+def shp_sources(testdata_shp_files, testdata_pal_files) -> tuple[Path, Path]:
+    """(pal, shp) pair for palette-dependent SHP exports."""
+    return palette_sources(testdata_shp_files, testdata_pal_files, "SHP")
+
+
+@pytest.fixture(scope="session")
+def wsa_sources(testdata_wsa_files, testdata_pal_files) -> tuple[Path, Path]:
+    """(pal, wsa) pair for palette-dependent WSA exports."""
+    return palette_sources(testdata_wsa_files, testdata_pal_files, "WSA")
+
+
 # === Temporary Directory Fixtures ===
 
 @pytest.fixture
-def temp_dir():
-    """Provide a temporary directory that's cleaned up after the test."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """Provide a per-test temporary directory (unique per xdist worker)."""
+    return tmp_path
 
 
 @pytest.fixture
 def temp_file(temp_dir):
     """Factory fixture for creating temporary files."""
-    def _create_temp_file(suffix: str = "", content: bytes = b"") -> Path:
+    def _create_temp_file(
+        suffix: str = "", content: bytes | bytearray | memoryview = b""
+    ) -> Path:
         path = temp_dir / f"test{suffix}"
         if content:
             path.write_bytes(content)
@@ -228,6 +306,41 @@ def temp_file(temp_dir):
     return _create_temp_file
 
 
+@pytest.fixture(scope="session")
+def shared_file(tmp_path_factory):
+    """Session factory for read-only input files, deduplicated by content."""
+    root = tmp_path_factory.mktemp("shared")
+    files = {}
+
+    def _shared_file(suffix: str, content: bytes) -> Path:
+        digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        key = (suffix, digest)
+        if key not in files:
+            path = root / f"{digest}{suffix}"
+            path.write_bytes(content)
+            files[key] = path
+        return files[key]
+    return _shared_file
+
+
+@pytest.fixture(scope="session")
+def bad_shp_file(shared_file) -> Path:
+    """SHP file of zeros with an invalid header."""
+    return shared_file(".shp", b"\x00" * 100)
+
+
+@pytest.fixture(scope="session")
+def truncated_shp_file(shared_file) -> Path:
+    """SHP file too short to hold a header."""
+    return shared_file(".shp", b"\x00" * 5)
+
+
+@pytest.fixture(scope="session")
+def bad_tmp_file(shared_file) -> Path:
+    """TMP file of zeros with invalid magic."""
+    return shared_file(".tmp", b"\x00" * 100)
+
+
 # === Tool Execution Helpers ===
 
 class ToolResult:
@@ -236,10 +349,18 @@ class ToolResult:
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
-        self.stdout_text = stdout.decode("utf-8", errors="replace")
-        self.stderr_text = stderr.decode("utf-8", errors="replace")
         self.stdout_bytes = stdout  # Alias for binary output
 
+    @functools.cached_property
+    def stdout_text(self) -> str:
+        """stdout decoded as UTF-8 (on first access)."""
+        return self.stdout.decode("utf-8", errors="replace")
+
+    @functools.cached_property
+    def stderr_text(self) -> str:
+        """stderr decoded as UTF-8 (on first access)."""
+        return self.stderr.decode("utf-8", errors="replace")
+
     @property
     def success(self) -> bool:
         return self.returncode == 0
@@ -282,19 +403,153 @@ def run_tool(tool_path: Path, *args, stdin_data: Optional[bytes] = None,
             input=stdin_data,
             capture_output=True,
             timeout=timeout,
-            cwd=cwd
+            cwd=cwd,
+            # The harness holds no fds worth hiding; skipping the close
+            # loop lets CPython use the cheaper posix_spawn/vfork path
+            close_fds=False
         )
         return ToolResult(result.returncode, result.stdout, result.stderr)
     except subprocess.TimeoutExpired:
         pytest.fail(f"Tool timed out after {timeout}s: {' '.join(cmd)}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def run(request):
     """Fixture that provides the run_tool helper."""
     return run_tool
 
 
+# === Cached Info Helpers ===
+
+def parse_json(data: bytes):
+    """Parse JSON tool output from raw bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def cached_info_json(tool_path: Path, run=run_tool,
+                     cache_dir: Optional[Path] = None):
+    """
+    Build a memoized `info --json` lookup for a tool.
+
+    Results are keyed on (path, mtime) so each file is inspected once per
+    session. If cache_dir is given, successful output is also stored there
+    so other pytest-xdist workers can reuse it. The returned callable maps
+    a path to (data, result), where data is None if the tool failed.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _info(path: str, mtime_ns: int):
+        cache_file = None
+        if cache_dir is not None:
+            key = hashlib.sha1(f"{path}:{mtime_ns}".encode()).hexdigest()
+            cache_file = cache_dir / f"{tool_path.name}-{key}.json"
+            if cache_file.exists():
+                stdout = cache_file.read_bytes()
+                return parse_json(stdout), ToolResult(0, stdout, b"")
+
+        result = run(tool_path, "info", "--json", path)
+        if not result.success:
+            return None, result
+        if cache_file is not None:
+            # Atomic publish; concurrent workers write identical content
+            partial = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_bytes(result.stdout)
+            os.replace(partial, cache_file)
+        return parse_json(result.stdout_bytes), result
+
+    def info_json(path: Path):
+        return _info(str(path), Path(path).stat().st_mtime_ns)
+    return info_json
+
+
+@pytest.fixture(scope="session")
+def info_cache_dir(tmp_path_factory) -> Path:
+    """Directory for info --json results shared across xdist workers."""
+    base = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        base = base.parent  # Worker basetemps live under the run's basetemp
+    path = base / "info-cache"
+    path.mkdir(exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def aud_info_json(aud_tool, run, info_cache_dir):
+    """Cached `aud-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(aud_tool, run, info_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def pal_info_json(pal_tool, run, info_cache_dir):
+    """Cached `pal-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(pal_tool, run, info_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def shp_info_json(shp_tool, run, info_cache_dir):
+    """Cached `shp-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(shp_tool, run, info_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def tmp_info_json(tmp_tool, run, info_cache_dir):
+    """Cached `tmp-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(tmp_tool, run, info_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def vqa_info_json(vqa_tool, run, info_cache_dir):
+    """Cached `vqa-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(vqa_tool, run, info_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def wsa_info_json(wsa_tool, run, info_cache_dir):
+    """Cached `wsa-tool info --json` lookup returning (data, result)."""
+    return cached_info_json(wsa_tool, run, info_cache_dir)
+
+
+def first_info(files, info_json, kind: str) -> dict:
+    """Parsed info --json for the first file, skipping when unavailable."""
+    if not files:
+        pytest.skip(f"No {kind} files in testdata")
+    data, _ = info_json(files[0])
+    if data is None:
+        pytest.skip("JSON output not implemented")
+    return data
+
+
+@pytest.fixture(scope="session")
+def aud_info(testdata_aud_files, aud_info_json) -> dict:
+    """aud-tool info --json for the first testdata AUD file."""
+    return first_info(testdata_aud_files, aud_info_json, "AUD")
+
+
+@pytest.fixture(scope="session")
+def pal_info(testdata_pal_files, pal_info_json) -> dict:
+    """pal-tool info --json for the first testdata PAL file."""
+    return first_info(testdata_pal_files, pal_info_json, "PAL")
+
+
+@pytest.fixture(scope="session")
+def shp_info(testdata_shp_files, shp_info_json) -> dict:
+    """shp-tool info --json for the first testdata SHP file."""
+    return first_info(testdata_shp_files, shp_info_json, "SHP")
+
+
+@pytest.fixture(scope="session")
+def vqa_info(testdata_vqa_files, vqa_info_json) -> dict:
+    """vqa-tool info --json for the first testdata VQA file."""
+    return first_info(testdata_vqa_files, vqa_info_json, "VQA")
+
+
+@pytest.fixture(scope="session")
+def wsa_info(testdata_wsa_files, wsa_info_json) -> dict:
+    """wsa-tool info --json for the first testdata WSA file."""
+    return first_info(testdata_wsa_files, wsa_info_json, "WSA")
+
+
 # === File Validation Helpers ===
 
 def is_valid_wav(path: Path) -> bool:
@@ -323,7 +578,6 @@ def is_valid_gif(path: Path) -> bool:
 
 def is_valid_json(path: Path) -> bool:
     """Check if file is valid JSON."""
-    import json
     try:
         json.loads(path.read_text())
         return True
@@ -342,6 +596,22 @@ def validate():
     return Validators()
 
 
+# === Memory-Mapped Output ===
+
+@contextlib.contextmanager
+def mmap_file(path: Path):
+    """Read-only mmap of path; the map and file close on exit."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+@pytest.fixture(scope="session")
+def mapped_file():
+    """Fixture providing the read-only mmap context manager."""
+    return mmap_file
+
+
 # === WAV Parsing Helper ===
 
 def parse_wav_header(path: Path) -> dict:
@@ -415,6 +685,52 @@ def parse_png():
     return get_png_info
 
 
+def get_png_rows(path: Path) -> list[bytes]:
+    """Decode PNG scanlines (8-bit, filter type None only)."""
+    data = path.read_bytes()
+    info = get_png_info(path)
+    channels = {0: 1, 2: 3, 4: 2, 6: 4}[info["color_type"]]
+    stride = info["width"] * channels
+
+    idat = bytearray()
+    pos = 8
+    while pos < len(data):
+        length = int.from_bytes(data[pos:pos + 4], "big")
+        chunk_type = data[pos + 4:pos + 8]
+        if chunk_type == b"IDAT":
+            idat += data[pos + 8:pos + 8 + length]
+        elif chunk_type == b"IEND":
+            break
+        pos += 12 + length
+
+    raw = zlib.decompress(idat)
+    rows = []
+    for y in range(info["height"]):
+        start = y * (stride + 1)
+        if raw[start] != 0:
+            raise ValueError(f"Unsupported PNG filter type {raw[start]}")
+        rows.append(raw[start + 1:start + 1 + stride])
+    return rows
+
+
+@pytest.fixture
+def png_rows():
+    """Fixture providing PNG scanline decoder."""
+    return get_png_rows
+
+
+# === Palette Helpers ===
+
+# 6-bit VGA DAC value -> 8-bit channel, indexed by the 6-bit value
+LUT_6TO8 = bytes((v << 2) | (v >> 4) for v in range(64))
+
+
+@pytest.fixture(scope="session")
+def lut_6to8() -> bytes:
+    """Fixture providing the reference 6-bit to 8-bit lookup table."""
+    return LUT_6TO8
+
+
 # === Golden File Comparison ===
 
 def compare_with_golden(
@@ -10,6 +10,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestAudToolInfo:
     """Test aud-tool info command."""
@@ -43,8 +45,7 @@ class TestAudToolInfo:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert "sample_rate" in data or "SampleRate" in data
 
     def test_info_multiple_files(self, aud_tool, testdata_aud_files, run):
@@ -78,13 +79,12 @@ class TestAudToolExport:
         if not testdata_aud_files:
             pytest.skip("No AUD files in testdata")
         import struct
-        import json
 
         # Get source rate
         info_result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         if info_result.returncode != 0:
             pytest.skip("Info not implemented")
-        info = json.loads(info_result.stdout_text)
+        info = parse_json(info_result.stdout)
         source_rate = info.get("sample_rate") or info.get("SampleRate")
 
         # Export
@@ -152,8 +152,7 @@ class TestAudToolWestwoodAdpcm:
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         if result.returncode != 0:
             pytest.skip("Info not implemented")
-        import json
-        info = json.loads(result.stdout_text)
+        info = parse_json(result.stdout)
         codec = info.get("codec") or info.get("Codec") or ""
         # Most RA AUDs use Westwood ADPCM
         assert "adpcm" in str(codec).lower()
@@ -162,7 +161,7 @@ class TestAudToolWestwoodAdpcm:
 class TestAudToolImaAdpcm:
     """Test IMA ADPCM (0x63) handling."""
 
+    @pytest.mark.skip(reason="Requires IMA ADPCM test file")
     def test_ima_codec_detection(self):
         """Test detection of IMA ADPCM codec."""
         # Tiberian Sun uses IMA ADPCM (0x63)
-        pytest.skip("Requires IMA ADPCM test file")
@@ -12,6 +12,8 @@ Tests cover:
 
 import pytest
 
+from conftest import parse_json
+
 
 class TestExitCodes:
     """Test standard exit codes."""
@@ -184,8 +186,7 @@ class TestJsonOption:
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         if result.returncode != 0:
             pytest.skip("JSON not implemented")
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
     def test_json_vs_human_readable(self, aud_tool, testdata_aud_files, run):
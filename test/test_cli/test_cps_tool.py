@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestCpsToolInfo:
     """Test cps-tool info command."""
@@ -57,8 +59,7 @@ class TestCpsToolInfo:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -10,6 +10,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestFntToolInfo:
     """Test fnt-tool info command."""
@@ -43,8 +45,7 @@ class TestFntToolInfo:
             pytest.skip("No FNT files in testdata")
         result = run(fnt_tool, "info", "--json", testdata_fnt_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -90,8 +91,7 @@ class TestFntToolMetrics:
         if result.returncode != 0:
             pytest.skip("Metrics export not implemented")
         assert out_file.exists()
-        import json
-        data = json.loads(out_file.read_text())
+        data = parse_json(out_file.read_bytes())
         assert "glyphs" in data
 
     def test_metrics_glyph_structure(
@@ -105,8 +105,7 @@ class TestFntToolMetrics:
                     "-o", str(out_file))
         if result.returncode != 0:
             pytest.skip("Metrics export not implemented")
-        import json
-        data = json.loads(out_file.read_text())
+        data = parse_json(out_file.read_bytes())
         # Glyphs should be keyed by character
         if "glyphs" in data:
             for key, glyph in data["glyphs"].items():
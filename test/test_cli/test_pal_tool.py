@@ -10,6 +10,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestPalToolInfo:
     """Test pal-tool info command."""
@@ -44,8 +46,7 @@ class TestPalToolInfo:
             pytest.skip("No PAL files in testdata")
         result = run(pal_tool, "info", "--json", testdata_pal_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestShpToolInfo:
     """Test shp-tool info command."""
@@ -45,8 +47,7 @@ class TestShpToolInfo:
             pytest.skip("No SHP files in testdata")
         result = run(shp_tool, "info", "--json", testdata_shp_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
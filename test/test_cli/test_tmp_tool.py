@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestTmpToolInfo:
     """Test tmp-tool info command."""
@@ -53,8 +55,7 @@ class TestTmpToolInfo:
             pytest.skip("No TMP files in testdata")
         result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -103,9 +104,9 @@ class TestTmpToolFormatDetection:
         result.assert_success()
         # Red Alert TMP has 0x2C73 magic at offset 26
 
+    @pytest.mark.skip(reason="Requires TD format TMP test file")
     def test_detect_td_format(self):
         """Test detection of Tiberian Dawn format."""
-        pytest.skip("Requires TD format TMP test file")
 
 
 class TestTmpToolErrors:
@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestVqaToolInfo:
     """Test vqa-tool info command."""
@@ -67,8 +69,7 @@ class TestVqaToolInfo:
             pytest.skip("No VQA files in testdata")
         result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -220,10 +221,10 @@ class TestVqaToolErrors:
 class TestVqaToolNoAudio:
     """Test VQA files without audio."""
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_video_only_export(self):
         """Test exporting video-only VQA."""
-        pytest.skip("Requires video-only VQA test file")
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_wav_export_skipped(self):
         """Test --wav is skipped for video-only VQA."""
-        pytest.skip("Requires video-only VQA test file")
@@ -12,6 +12,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestWsaToolInfo:
     """Test wsa-tool info command."""
@@ -53,8 +55,7 @@ class TestWsaToolInfo:
             pytest.skip("No WSA files in testdata")
         result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
 
@@ -222,10 +222,10 @@ class TestPartialProcessing:
         # Should process the good file even if bad file fails
         # (specific behavior depends on implementation)
 
+    @pytest.mark.skip(reason="Requires specially crafted test file")
     def test_output_on_decode_error(
         self, vqa_tool, testdata_vqa_files, testdata_pal_files, run, temp_dir
     ):
         """Test partial output on decode error."""
         # This tests if tool can produce partial output when decode
         # fails mid-stream
-        pytest.skip("Requires specially crafted test file")
@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestUnitAnimationWorkflow:
     """Test processing unit animation assets."""
@@ -29,8 +31,7 @@ class TestUnitAnimationWorkflow:
             if info_result.returncode != 0:
                 continue
 
-            import json
-            info = json.loads(info_result.stdout_text)
+            info = parse_json(info_result.stdout)
             frames = info.get("frames") or info.get("Frames") or 0
 
             if frames > 1:
@@ -103,8 +104,7 @@ class TestCutsceneWorkflow:
         if info_result.returncode != 0:
             pytest.skip("VQA info not implemented")
 
-        import json
-        info = json.loads(info_result.stdout_text)
+        info = parse_json(info_result.stdout)
 
         # Export to MP4
         mp4_file = temp_dir / "cutscene.mp4"
@@ -158,8 +158,7 @@ class TestFontWorkflow:
                             testdata_fnt_files[0], "-o", str(json_file))
         if metrics_result.returncode == 0:
             assert json_file.exists()
-            import json
-            metrics = json.loads(json_file.read_text())
+            metrics = parse_json(json_file.read_bytes())
             assert "glyphs" in metrics
 
 
@@ -10,6 +10,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestAudioGoldenFiles:
     """Test audio output against golden files."""
@@ -125,9 +127,8 @@ class TestJsonGoldenFiles:
         if result.returncode != 0:
             pytest.skip("JSON info not implemented")
 
-        import json
-        actual = json.loads(result.stdout_text)
-        expected = json.loads(golden_json.read_text())
+        actual = parse_json(result.stdout)
+        expected = parse_json(golden_json.read_bytes())
 
         assert actual == expected, "JSON info mismatch"
 
@@ -10,6 +10,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestMixToAudioWorkflow:
     """Test extracting and processing audio from MIX."""
@@ -224,13 +226,13 @@ class TestBatchProcessingWorkflow:
 class TestPipelineWithStdio:
     """Test pipeline using stdin/stdout."""
 
+    @pytest.mark.skip(reason="Requires shell pipeline testing")
     def test_pipe_extract_to_decode(
         self, mix_tool, aud_tool, testdata_mix_files, run, temp_dir
     ):
         """Test piping extraction directly to decoder."""
         # This would test:
         # mix-tool extract MIX file - | aud-tool export - -o out.wav
-        pytest.skip("Requires shell pipeline testing")
 
     def test_info_to_json_processing(self, aud_tool, testdata_aud_files, run):
         """Test piping JSON info output."""
@@ -243,6 +245,5 @@ class TestPipelineWithStdio:
             pytest.skip("JSON info not implemented")
 
         # Parse the JSON
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
@@ -12,6 +12,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestAudHeaderParsing:
     """Test AUD header parsing."""
@@ -82,8 +84,7 @@ class TestAudWestwoodAdpcm:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Should have codec info
         assert any(k in data for k in ["codec", "Codec", "codecType"])
 
@@ -109,8 +110,7 @@ class TestAudImaAdpcm:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Should have channel info
         channels = data.get("channels") or data.get("numChannels", 0)
         assert channels in [1, 2]  # Mono or stereo
@@ -121,8 +121,7 @@ class TestAudImaAdpcm:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Should have sample rate info
         rate = data.get("sampleRate") or data.get("sample_rate", 0)
         assert rate > 0
@@ -151,8 +150,7 @@ class TestAudChunkValidation:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Should have some size information
         assert isinstance(data, dict)
 
@@ -176,8 +174,7 @@ class TestAudInfoOutput:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
     def test_info_fields_complete(self, aud_tool, testdata_aud_files, run):
@@ -186,8 +183,7 @@ class TestAudInfoOutput:
             pytest.skip("No AUD files in testdata")
         result = run(aud_tool, "info", "--json", testdata_aud_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Check for key fields
         assert any(k in data for k in ["sampleRate", "sample_rate"])
         assert any(k in data for k in ["channels", "numChannels"])
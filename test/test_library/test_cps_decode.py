@@ -12,6 +12,8 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
+
 
 class TestCpsHeaderParsing:
     """Test CPS header parsing."""
@@ -29,8 +31,7 @@ class TestCpsHeaderParsing:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
     def test_compression_field(self, cps_tool, testdata_cps_files, run):
@@ -51,8 +52,7 @@ class TestCpsHeaderParsing:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # CPS images are always 320x200
         if "width" in data and "height" in data:
             assert data["width"] == 320
@@ -75,9 +75,9 @@ class TestCpsHeaderParsing:
 class TestCpsCompressionTypes:
     """Test compression type detection and handling."""
 
+    @pytest.mark.skip(reason="Requires uncompressed CPS test file")
     def test_compression_none(self):
         """Test uncompressed CPS (method 0x0000)."""
-        pytest.skip("Requires uncompressed CPS test file")
 
     def test_compression_lcw(self, cps_tool, testdata_cps_files, run):
         """Test LCW compressed CPS (method 0x0004)."""
@@ -87,24 +87,23 @@ class TestCpsCompressionTypes:
         for cps_file in testdata_cps_files:
             result = run(cps_tool, "info", "--json", cps_file)
             if result.success:
-                import json
-                data = json.loads(result.stdout_text)
+                data = parse_json(result.stdout)
                 if data.get("compression") == "LCW":
                     assert data["uncompressed_size"] == 64000  # 320x200
                     return
         pytest.skip("No LCW compressed CPS file found")
 
+    @pytest.mark.skip(reason="Requires LZW-12 compressed CPS test file")
     def test_compression_lzw12(self):
         """Test LZW-12 compressed CPS (method 0x0001)."""
-        pytest.skip("Requires LZW-12 compressed CPS test file")
 
+    @pytest.mark.skip(reason="Requires LZW-14 compressed CPS test file")
     def test_compression_lzw14(self):
         """Test LZW-14 compressed CPS (method 0x0002)."""
-        pytest.skip("Requires LZW-14 compressed CPS test file")
 
+    @pytest.mark.skip(reason="Requires RLE compressed CPS test file")
     def test_compression_rle(self):
         """Test RLE compressed CPS (method 0x0003)."""
-        pytest.skip("Requires RLE compressed CPS test file")
 
 
 class TestCpsEmbeddedPalette:
@@ -116,8 +115,7 @@ class TestCpsEmbeddedPalette:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Should report palette information
         assert isinstance(data, dict)
 
@@ -130,10 +128,10 @@ class TestCpsEmbeddedPalette:
         result = run(cps_tool, "info", testdata_cps_files[0])
         result.assert_success()
 
+    @pytest.mark.skip(reason="Requires unit test of CPS parser")
     def test_palette_at_offset_10(self):
         """Test palette starts at offset 10 after header."""
         # This is a unit test of the file format, not CLI tool behavior
-        pytest.skip("Requires unit test of CPS parser")
 
 
 class TestCpsImageData:
@@ -145,8 +143,7 @@ class TestCpsImageData:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert data["uncompressed_size"] == 64000
 
     def test_dimensions(self, cps_tool, testdata_cps_files, run):
@@ -155,8 +152,7 @@ class TestCpsImageData:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert data["width"] == 320
         assert data["height"] == 200
 
@@ -192,8 +188,7 @@ class TestCpsInfoOutput:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert isinstance(data, dict)
 
     def test_info_fields_complete(self, cps_tool, testdata_cps_files, run):
@@ -202,8 +197,7 @@ class TestCpsInfoOutput:
             pytest.skip("No CPS files in testdata")
         result = run(cps_tool, "info", "--json", testdata_cps_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Check for key fields (names may vary)
         assert any(k in data for k in ["width", "Width"])
         assert any(k in data for k in ["height", "Height"])
@@ -10,7 +10,20 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+from conftest import parse_json
 
+# Zero padding around the distinctive color slots at indices 0, 1 and 255
+ZERO759 = bytes(759)
+
+
+def swatch_pixel(rows, index) -> bytes:
+    """RGB of the top-left pixel of swatch cell index (16x16 of 32x32)."""
+    row = rows[(index // 16) * 32]
+    x = (index % 16) * 32 * 3
+    return row[x:x + 3]
+
+
+@pytest.mark.xdist_group(name="pal")
 class TestPalValidation:
     """Test PAL file validation."""
 
@@ -21,23 +34,15 @@ class TestPalValidation:
         result = run(pal_tool, "info", testdata_pal_files[0])
         result.assert_success()
 
-    def test_invalid_size_too_small(self, pal_tool, temp_file, run):
-        """Test rejection of undersized PAL file."""
-        small = temp_file(".pal", b"\x00" * 767)
-        result = run(pal_tool, "info", small)
-        result.assert_exit_code(2)
-
-    def test_invalid_size_too_large(self, pal_tool, temp_file, run):
-        """Test rejection of oversized PAL file."""
-        large = temp_file(".pal", b"\x00" * 769)
-        result = run(pal_tool, "info", large)
-        result.assert_exit_code(2)
-
-    def test_exact_768_bytes(self, pal_tool, temp_file, run):
-        """Test acceptance of exactly 768 bytes."""
-        valid = temp_file(".pal", b"\x00" * 768)
-        result = run(pal_tool, "info", valid)
-        result.assert_success()
+    @pytest.mark.parametrize("size,exit_code", [
+        (767, 2),  # Undersized
+        (768, 0),  # Exact
+        (769, 2),  # Oversized
+    ])
+    def test_size_validation(self, pal_tool, temp_file, run, size, exit_code):
+        """Test only exactly 768-byte PAL files are accepted."""
+        result = run(pal_tool, "info", temp_file(".pal", bytes(size)))
+        result.assert_exit_code(exit_code)
 
 
 class TestPalColorConversion:
@@ -67,55 +72,65 @@ class TestPalColorConversion:
             result = convert_6to8(val)
             assert 0 <= result <= 255
 
-
-class TestPalColorOrder:
-    """Test color index ordering."""
-
-    def test_index_0_first(self, pal_tool, temp_file, run, temp_dir):
-        """Test index 0 is at byte offset 0."""
-        # Create PAL with distinctive color at index 0: pure red (63,0,0)
-        pal = bytearray(768)
-        pal[0:3] = [63, 0, 0]  # Index 0 = red
-        pal_file = temp_file(".pal", bytes(pal))
-
-        # Export to PNG and check first swatch is red
+    def test_decoder_matches_lut(self, pal_tool, temp_file, run, temp_dir,
+                                 png_rows, lut_6to8):
+        """Test exported swatch colors match the 6-to-8 bit lookup table."""
+        # Byte k of the ramp is k % 64, so every 6-bit value is exercised
+        pal_file = temp_file(".pal", bytes(range(64)) * 12)
         png_file = temp_dir / "swatch.png"
         result = run(pal_tool, "export", pal_file, "-o", str(png_file))
         result.assert_success()
 
-        # Verify PNG was created and has correct first color
-        assert png_file.exists()
-        data = png_file.read_bytes()
-        assert data[:8] == b"\x89PNG\r\n\x1a\n"  # Valid PNG
+        # 16x16 grid of 32x32 swatches; sample each swatch's top-left pixel
+        rows = png_rows(png_file)
+        for index in range(256):
+            expected = bytes(lut_6to8[(index * 3 + c) % 64] for c in range(3))
+            assert swatch_pixel(rows, index) == expected, f"index {index}"
+
+
+@pytest.fixture(scope="session")
+def distinctive_pal_png(pal_tool, run, tmp_path_factory):
+    """Export a PAL with distinctive colors at indices 0, 1 and 255 once."""
+    pal = b"".join((
+        bytes((63, 0, 0)),    # Index 0 = red
+        bytes((10, 20, 30)),  # Index 1 = (10,20,30)
+        ZERO759,
+        bytes((0, 0, 63)),    # Index 255 = blue
+    ))
+    out_dir = tmp_path_factory.mktemp("pal_color_order")
+    pal_file = out_dir / "test.pal"
+    pal_file.write_bytes(pal)
+
+    png_file = out_dir / "swatch.png"
+    result = run(pal_tool, "export", pal_file, "-o", str(png_file))
+    result.assert_success()
+    return png_file
+
+
+@pytest.mark.xdist_group(name="pal")
+class TestPalColorOrder:
+    """Test color index ordering."""
 
-    def test_index_255_last(self, pal_tool, temp_file, run, temp_dir):
-        """Test index 255 is at byte offset 765-767."""
-        # Create PAL with distinctive color at index 255: pure blue (0,0,63)
-        pal = bytearray(768)
-        pal[765:768] = [0, 0, 63]  # Index 255 = blue
-        pal_file = temp_file(".pal", bytes(pal))
+    def test_index_0_first(self, distinctive_pal_png, png_rows):
+        """Test palette entry 0 fills the first swatch cell."""
+        rows = png_rows(distinctive_pal_png)
+        assert swatch_pixel(rows, 0) == bytes((255, 0, 0))
 
-        # Export should work - verifies format parsing
-        png_file = temp_dir / "swatch.png"
-        result = run(pal_tool, "export", pal_file, "-o", str(png_file))
-        result.assert_success()
-        assert png_file.exists()
+    def test_index_255_last(self, distinctive_pal_png, png_rows):
+        """Test palette entry 255 fills the last (bottom-right) swatch cell."""
+        rows = png_rows(distinctive_pal_png)
+        assert swatch_pixel(rows, 255) == bytes((0, 0, 255))
 
-    def test_rgb_triplet_order(self, pal_tool, temp_file, run, temp_dir):
+    def test_rgb_triplet_order(self, distinctive_pal_png, png_rows, lut_6to8):
         """Test R, G, B byte order within each triplet."""
-        # Create PAL with specific R,G,B values at index 1
-        # R=10, G=20, B=30 to verify ordering
-        pal = bytearray(768)
-        pal[3:6] = [10, 20, 30]  # Index 1 = (10,20,30)
-        pal_file = temp_file(".pal", bytes(pal))
-
-        # Export verifies the format is parsed correctly
-        png_file = temp_dir / "swatch.png"
-        result = run(pal_tool, "export", pal_file, "-o", str(png_file))
-        result.assert_success()
-        assert png_file.exists()
+        # Entry 1 is (10, 20, 30); any channel swap changes the pixel
+        rows = png_rows(distinctive_pal_png)
+        expected = bytes((lut_6to8[10], lut_6to8[20], lut_6to8[30]))
+        assert expected == bytes((40, 81, 121))
+        assert swatch_pixel(rows, 1) == expected
 
 
+@pytest.mark.xdist_group(name="pal")
 class TestPalInfoOutput:
     """Test pal-tool info command output."""
 
@@ -129,20 +144,18 @@ class TestPalInfoOutput:
 
     def test_info_json(self, pal_tool, temp_file, run):
         """Test JSON info output format."""
-        import json
         valid = temp_file(".pal", b"\x00" * 768)
         result = run(pal_tool, "info", "--json", valid)
         result.assert_success()
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         assert data["colors"] == 256
 
     def test_info_fields_complete(self, pal_tool, temp_file, run):
         """Test all required info fields are present."""
-        import json
         valid = temp_file(".pal", b"\x00" * 768)
         result = run(pal_tool, "info", "--json", valid)
         result.assert_success()
-        data = json.loads(result.stdout_text)
+        data = parse_json(result.stdout)
         # Required fields
         assert "colors" in data
         assert "bit_depth" in data or "bitDepth" in data
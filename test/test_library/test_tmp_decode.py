@@ -12,110 +12,83 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+# Keep the module on one xdist worker so the info cache stays warm
+pytestmark = pytest.mark.xdist_group(name="tmp")
+
 
 class TestTmpFormatDetection:
     """Test TMP format detection."""
 
-    def test_detect_ra_format(self, tmp_tool, testdata_tmp_files, run):
+    def test_detect_ra_format(self, tmp_info_json, first_tmp):
         """Test detection of Red Alert format (0x2C73 at offset 26)."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
+        assert "format" in data
 
-    def test_detect_td_format(self, tmp_tool, testdata_tmp_files, run):
+    def test_detect_td_format(self, tmp_info_json, first_tmp):
         """Test detection of Tiberian Dawn format (0x0D1AFFFF at offset 20)."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        # Red Alert TMP files should be detected
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
+        # TD and RA orthographic tilesets share the reader; either is fine
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
+        assert data["format"].split()[0] in ("TD", "RA")
 
-    def test_invalid_magic(self, tmp_tool, temp_file, run):
+    def test_invalid_magic(self, tmp_tool, bad_tmp_file, run):
         """Test rejection of file with invalid magic."""
-        bad_file = temp_file(".tmp", b"\x00" * 100)
-        result = run(tmp_tool, "info", bad_file)
+        result = run(tmp_tool, "info", bad_tmp_file)
         result.assert_exit_code(2)
 
 
 class TestTmpHeaderParsing:
     """Test TMP header parsing."""
 
-    def test_tile_dimensions(self, tmp_tool, testdata_tmp_files, run):
-        """Test tile width/height extraction (typically 24x24)."""
-        if not testdata_tmp_files:
-            pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
-        result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
-        # Should have tile dimension info
-        assert any(k in data for k in ["tileWidth", "tile_width", "width"])
-
-    def test_tile_count(self, tmp_tool, testdata_tmp_files, run):
-        """Test tile count extraction."""
-        if not testdata_tmp_files:
-            pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
-        result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
-        # Should have tile count info
-        assert any(
-            k in data for k in ["tiles", "tileCount", "tile_count",
-                                "numTiles"]
-        )
-
-    def test_img_start_offset(self, tmp_tool, testdata_tmp_files, run):
-        """Test ImgStart offset extraction."""
-        if not testdata_tmp_files:
-            pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
-        result.assert_success()
-
-    def test_index_offsets(self, tmp_tool, testdata_tmp_files, run):
-        """Test IndexStart/IndexEnd offset extraction."""
-        if not testdata_tmp_files:
+    @pytest.mark.parametrize("keys", [
+        ("tileWidth", "tile_width", "width"),
+        ("tiles", "tileCount", "tile_count", "numTiles"),
+        ("image_offset",),
+        ("index_offset",),
+    ])
+    def test_header_field(self, tmp_info_json, first_tmp, keys):
+        """Test tile dimensions, tile count and ImgStart/Index offsets."""
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
+        assert any(k in data for k in keys)
 
 
 class TestTmpIndexTable:
     """Test index table parsing."""
 
-    def test_index_table_size(self, tmp_tool, testdata_tmp_files, run):
+    def test_index_table_size(self, tmp_info_json, first_tmp):
         """Test index table has correct number of entries."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         tiles = data.get("tiles", 0)
         assert tiles > 0
 
-    def test_valid_indices(self, tmp_tool, testdata_tmp_files, run):
+    def test_valid_indices(self, tmp_info_json, first_tmp):
         """Test tile indices are in valid range."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # empty_tiles should be <= total tiles
         empty = data.get("empty_tiles", 0)
         tiles = data.get("tiles", 0)
         assert empty <= tiles
 
-    def test_empty_tile_marker(self, tmp_tool, testdata_tmp_files, run):
+    def test_empty_tile_marker(self, tmp_info_json, first_tmp):
         """Test 0xFF marks empty/null tile."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # empty_tiles count is extracted - 0xFF markers are counted
         assert "empty_tiles" in data
 
@@ -123,21 +96,20 @@ class TestTmpIndexTable:
 class TestTmpEmptyTiles:
     """Test empty tile handling."""
 
-    def test_count_empty_tiles(self, tmp_tool, testdata_tmp_files, run):
+    def test_count_empty_tiles(self, tmp_info_json, first_tmp):
         """Test counting empty tiles in template."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
+        assert data.get("empty_tiles", 0) <= data.get("tiles", 0)
 
-    def test_empty_tiles_in_json(self, tmp_tool, testdata_tmp_files, run):
+    def test_empty_tiles_in_json(self, tmp_info_json, first_tmp):
         """Test empty tile count is reported in JSON output."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # Empty tiles count should be present and non-negative
         empty = data.get("empty_tiles", 0)
         assert empty >= 0
@@ -146,15 +118,12 @@ class TestTmpEmptyTiles:
 class TestTmpTileData:
     """Test tile pixel data extraction."""
 
-    def test_tile_dimensions_consistent(
-            self, tmp_tool, testdata_tmp_files, run):
+    def test_tile_dimensions_consistent(self, tmp_info_json, first_tmp):
         """Test tile dimensions are reported consistently."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # Tile dimensions should be present
         width = (data.get("tileWidth") or data.get("tile_width") or
                  data.get("width", 0))
@@ -164,28 +133,26 @@ class TestTmpTileData:
         assert width > 0
         assert height > 0
 
-    def test_tile_export(
-            self, tmp_tool, testdata_tmp_files, testdata_pal_files, run,
-            temp_dir):
+    def test_tile_export(self, tmp_tool, run, temp_dir, first_pal, first_tmp):
         """Test exporting tiles to PNG."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        if not testdata_pal_files:
+        if first_pal is None:
             pytest.skip("No PAL files in testdata")
-        result = run(tmp_tool, "export", "-p", testdata_pal_files[0],
-                    testdata_tmp_files[0], "-o", str(temp_dir / "tile.png"))
+        result = run(tmp_tool, "export", "-p", first_pal,
+                    first_tmp, "-o", str(temp_dir / "tile.png"))
         result.assert_success()
         # Should create at least one PNG
-        png_files = list(temp_dir.glob("*.png"))
-        assert len(png_files) >= 1
+        assert next(temp_dir.glob("*.png"), None) is not None
 
     def test_palette_required_for_export(
-            self, tmp_tool, testdata_tmp_files, run, temp_dir):
+        self, tmp_tool, run, temp_dir, first_tmp
+    ):
         """Test export requires palette file."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
         # Export without palette should fail or warn
-        result = run(tmp_tool, "export", testdata_tmp_files[0], "-o",
+        result = run(tmp_tool, "export", first_tmp, "-o",
                      str(temp_dir / "tile.png"))
         # Either fails or uses default palette
         # Verify command completes (may succeed with embedded/default
@@ -195,31 +162,27 @@ class TestTmpTileData:
 class TestTmpInfoOutput:
     """Test tmp-tool info command output."""
 
-    def test_info_human_readable(self, tmp_tool, testdata_tmp_files, run):
+    def test_info_human_readable(self, tmp_tool, run, first_tmp):
         """Test human-readable info output format."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", testdata_tmp_files[0])
+        result = run(tmp_tool, "info", first_tmp)
         result.assert_success()
         assert len(result.stdout_text) > 0
 
-    def test_info_json(self, tmp_tool, testdata_tmp_files, run):
+    def test_info_json(self, tmp_info_json, first_tmp):
         """Test JSON info output format."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         assert isinstance(data, dict)
 
-    def test_info_fields_complete(self, tmp_tool, testdata_tmp_files, run):
+    def test_info_fields_complete(self, tmp_info_json, first_tmp):
         """Test all required info fields are present."""
-        if not testdata_tmp_files:
+        if first_tmp is None:
             pytest.skip("No TMP files in testdata")
-        result = run(tmp_tool, "info", "--json", testdata_tmp_files[0])
+        data, result = tmp_info_json(first_tmp)
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # Check for key fields
         assert any(k in data for k in ["tiles", "tileCount", "numTiles"])
@@ -12,6 +12,9 @@ Tests cover:
 import pytest
 from pathlib import Path
 
+# 5-bit to 8-bit channel expansion for V3 RGB555 pixels
+CH5_TO_8 = bytes(v << 3 for v in range(32))
+
 
 class TestVqaContainerParsing:
     """Test IFF container parsing."""
@@ -29,73 +32,44 @@ class TestVqaContainerParsing:
             pytest.skip("No VQA files in testdata")
         result = run(vqa_tool, "info", testdata_vqa_files[0])
         result.assert_success()
-        assert "VQA" in result.stdout_text
+        assert b"VQA" in result.stdout
 
+    @pytest.mark.skip(reason="Requires unit test of parser")
     def test_chunk_alignment(self):
         """Test IFF chunk even-byte alignment."""
-        pytest.skip("Requires unit test of parser")
 
+    @pytest.mark.skip(reason="Requires unit test of parser")
     def test_big_endian_chunk_sizes(self):
         """Test chunk sizes are big-endian."""
-        pytest.skip("Requires unit test of parser")
 
-    def test_invalid_form(self, vqa_tool, temp_file, run):
+    def test_invalid_form(self, vqa_tool, shared_file, run):
         """Test rejection of non-FORM file."""
-        bad_file = temp_file(".vqa", b"NOTFORM\x00" * 100)
+        bad_file = shared_file(".vqa", b"NOTFORM\x00" * 100)
         result = run(vqa_tool, "info", bad_file)
         result.assert_exit_code(2)
 
 
+@pytest.mark.xdist_group(name="vqa_info")
 class TestVqaHeaderParsing:
     """Test VQHD header chunk parsing."""
 
-    def test_version_field(self, vqa_tool, testdata_vqa_files, run):
-        """Test version extraction (1, 2, or 3)."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
-        assert "version" in data or "Version" in str(data)
-
-    def test_dimensions(self, vqa_tool, testdata_vqa_files, run):
-        """Test width/height extraction."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", testdata_vqa_files[0])
-        result.assert_success()
-        # Should contain dimensions like "320x200"
-        assert "x" in result.stdout_text or "×" in result.stdout_text
-
-    def test_frame_count(self, vqa_tool, testdata_vqa_files, run):
-        """Test NumFrames extraction."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", testdata_vqa_files[0])
-        result.assert_success()
-
-    def test_block_size(self, vqa_tool, testdata_vqa_files, run):
-        """Test BlockW/BlockH extraction."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", testdata_vqa_files[0])
-        result.assert_success()
-
-    def test_frame_rate(self, vqa_tool, testdata_vqa_files, run):
-        """Test FrameRate extraction."""
+    @pytest.mark.parametrize("section,keys", [
+        (None, ("version",)),
+        ("video", ("width", "height")),
+        ("video", ("frames",)),
+        ("video", ("blockWidth", "blockHeight")),
+        ("video", ("frameRate",)),
+        ("audio", ("present",)),
+    ])
+    def test_header_field(self, testdata_vqa_files, vqa_info_json,
+                          section, keys):
+        """Test VQHD version, dimensions, frames, blocks, rate and audio."""
         if not testdata_vqa_files:
             pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", testdata_vqa_files[0])
-        result.assert_success()
-        assert "fps" in result.stdout_text.lower()
-
-    def test_audio_params(self, vqa_tool, testdata_vqa_files, run):
-        """Test Freq/Channels/Bits extraction."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", testdata_vqa_files[0])
+        data, result = vqa_info_json(testdata_vqa_files[0])
         result.assert_success()
+        fields = data[section] if section else data
+        assert all(k in fields for k in keys)
 
 
 class TestVqaVersionDetection:
@@ -114,37 +88,37 @@ class TestVqaVersionDetection:
 class TestVqaCodebook:
     """Test codebook handling."""
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_cbf_full_codebook(self):
         """Test CBF chunk replaces entire codebook."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_cbp_partial_codebook(self):
         """Test CBP chunk updates codebook segment."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_cbfz_decompression(self):
         """Test CBFZ LCW decompression with mode detection."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_cbp_accumulation(self):
         """Test CBP segments accumulate over CBParts frames."""
-        pytest.skip("Requires unit test of decoder")
 
 
 class TestVqaVectorPointers:
     """Test VPT frame rendering."""
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_v2_split_byte_format(self):
         """Test v2 lo/hi byte split format."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_solid_color_marker(self):
         """Test hi=0x0F indicates solid color."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_vptz_decompression(self):
         """Test VPTZ LCW decompression."""
-        pytest.skip("Requires unit test of decoder")
 
 
 class TestVqaV3HiColor:
@@ -153,10 +127,9 @@ class TestVqaV3HiColor:
     def test_rgb555_to_rgb888(self):
         """Test RGB555 to RGB888 conversion."""
         def rgb555_to_rgb888(pixel):
-            r = ((pixel >> 10) & 0x1F) << 3
-            g = ((pixel >> 5) & 0x1F) << 3
-            b = (pixel & 0x1F) << 3
-            return (r, g, b)
+            return (CH5_TO_8[(pixel >> 10) & 0x1F],
+                    CH5_TO_8[(pixel >> 5) & 0x1F],
+                    CH5_TO_8[pixel & 0x1F])
 
         # Black
         assert rgb555_to_rgb888(0x0000) == (0, 0, 0)
@@ -168,40 +141,44 @@ class TestVqaV3HiColor:
         assert rgb555_to_rgb888(0x03E0) == (0, 248, 0)
         # Pure blue
         assert rgb555_to_rgb888(0x001F) == (0, 0, 248)
+        # High bit is not part of the color
+        assert rgb555_to_rgb888(0xFFFF) == (248, 248, 248)
+        assert rgb555_to_rgb888(0x8000) == (0, 0, 0)
 
 
 class TestVqaAudio:
     """Test audio chunk decoding."""
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_snd0_raw_pcm(self):
         """Test SND0 raw PCM extraction."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_snd1_westwood_adpcm(self):
         """Test SND1 Westwood ADPCM decoding."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_snd2_ima_adpcm(self):
         """Test SND2 IMA ADPCM decoding."""
-        pytest.skip("Requires unit test of decoder")
 
+    @pytest.mark.skip(reason="Requires unit test of decoder")
     def test_stereo_channel_split(self):
         """Test stereo audio channel splitting and interleaving."""
-        pytest.skip("Requires unit test of decoder")
 
 
 class TestVqaNoAudio:
     """Test VQA without audio track."""
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_video_only_detection(self):
         """Test detection of video-only VQA."""
-        pytest.skip("Requires video-only VQA test file")
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_video_only_export(self):
         """Test export of video-only VQA."""
-        pytest.skip("Requires video-only VQA test file")
 
 
+@pytest.mark.xdist_group(name="vqa_info")
 class TestVqaInfoOutput:
     """Test vqa-tool info command output."""
 
@@ -212,25 +189,22 @@ class TestVqaInfoOutput:
         result = run(vqa_tool, "info", testdata_vqa_files[0])
         result.assert_success()
         # Check key sections
-        assert "Video" in result.stdout_text or "video" in result.stdout_text
+        assert b"Video" in result.stdout or b"video" in result.stdout
+        assert b"fps" in result.stdout or b"FPS" in result.stdout
 
-    def test_info_json(self, vqa_tool, testdata_vqa_files, run):
+    def test_info_json(self, testdata_vqa_files, vqa_info_json):
         """Test JSON info output format."""
         if not testdata_vqa_files:
             pytest.skip("No VQA files in testdata")
-        import json
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
+        data, result = vqa_info_json(testdata_vqa_files[0])
         result.assert_success()
-        data = json.loads(result.stdout_text)
         assert isinstance(data, dict)
 
-    def test_info_fields_complete(self, vqa_tool, testdata_vqa_files, run):
+    def test_info_fields_complete(self, testdata_vqa_files, vqa_info_json):
         """Test all required info fields are present."""
         if not testdata_vqa_files:
             pytest.skip("No VQA files in testdata")
-        import json
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
+        data, result = vqa_info_json(testdata_vqa_files[0])
         result.assert_success()
         # Should have video and audio sections with appropriate fields
-        data = json.loads(result.stdout_text)
         assert data is not None
@@ -13,62 +13,64 @@ import pytest
 from pathlib import Path
 
 
+@pytest.fixture(scope="session")
+def wsa_decoded_outputs(wsa_tool, testdata_wsa_files, testdata_pal_files,
+                        run, tmp_path_factory):
+    """Decode the first testdata WSA once; returns (out_dir, gif_path)."""
+    if not testdata_wsa_files:
+        pytest.skip("No WSA files in testdata")
+    if not testdata_pal_files:
+        pytest.skip("No PAL files in testdata")
+    out_dir = tmp_path_factory.mktemp("wsa_decoded")
+    # wsa-tool writes either a PNG sequence or a GIF per export
+    result = run(
+        wsa_tool, "export", "--frames", "-p", testdata_pal_files[0],
+        testdata_wsa_files[0], "-o", str(out_dir / "frame.png")
+    )
+    result.assert_success()
+
+    gif_path = out_dir / "anim.gif"
+    result = run(wsa_tool, "export", "-p", testdata_pal_files[0],
+                 testdata_wsa_files[0], "-o", str(gif_path))
+    result.assert_success()
+    return out_dir, gif_path
+
+
+@pytest.mark.xdist_group(name="wsa_info")
 class TestWsaHeaderParsing:
     """Test WSA header parsing."""
 
-    def test_valid_header(self, wsa_tool, testdata_wsa_files, run):
-        """Test parsing valid WSA header."""
+    @pytest.mark.parametrize("keys", [
+        ("frames", "frameCount", "numFrames"),
+        ("width", "Width"),
+        ("height", "Height"),
+        ("delta_buffer", "deltaBuffer"),
+    ])
+    def test_header_field(self, testdata_wsa_files, wsa_info_json, keys):
+        """Test frame count, dimensions and delta buffer size extraction."""
         if not testdata_wsa_files:
             pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", testdata_wsa_files[0])
+        data, result = wsa_info_json(testdata_wsa_files[0])
         result.assert_success()
+        assert any(k in data for k in keys)
 
-    def test_frame_count(self, wsa_tool, testdata_wsa_files, run):
-        """Test frame count extraction."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
-        result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
-        assert any(k in data for k in ["frames", "frameCount", "numFrames"])
-
-    def test_dimensions(self, wsa_tool, testdata_wsa_files, run):
-        """Test width/height extraction."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
-        result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
-        assert any(k in data for k in ["width", "Width"])
-        assert any(k in data for k in ["height", "Height"])
-
-    def test_delta_buffer_size(self, wsa_tool, testdata_wsa_files, run):
-        """Test delta buffer size extraction."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", testdata_wsa_files[0])
-        result.assert_success()
-
-    def test_invalid_header(self, wsa_tool, temp_file, run):
+    def test_invalid_header(self, wsa_tool, shared_file, run):
         """Test rejection of invalid WSA file."""
-        bad_file = temp_file(".wsa", b"\x00" * 100)
+        bad_file = shared_file(".wsa", b"\x00" * 100)
         result = run(wsa_tool, "info", bad_file)
         result.assert_exit_code(2)
 
 
+@pytest.mark.xdist_group(name="wsa_info")
 class TestWsaEmbeddedPalette:
     """Test embedded palette handling."""
 
-    def test_detect_embedded_palette(self, wsa_tool, testdata_wsa_files, run):
+    def test_detect_embedded_palette(self, testdata_wsa_files, wsa_info_json):
         """Test detection of embedded palette (Flags bit 0)."""
         if not testdata_wsa_files:
             pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
+        data, result = wsa_info_json(testdata_wsa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         assert isinstance(data, dict)
 
     def test_no_embedded_palette(self, wsa_tool, testdata_wsa_files, run):
@@ -78,22 +80,21 @@ class TestWsaEmbeddedPalette:
         result = run(wsa_tool, "info", testdata_wsa_files[0])
         result.assert_success()
 
+    @pytest.mark.skip(reason="Requires unit test of WSA parser")
     def test_palette_at_correct_offset(self):
         """Test palette is read from correct offset after frame offsets."""
-        pytest.skip("Requires unit test of WSA parser")
 
 
+@pytest.mark.xdist_group(name="wsa_info")
 class TestWsaFrameOffsetTable:
     """Test frame offset table parsing."""
 
-    def test_offset_table_size(self, wsa_tool, testdata_wsa_files, run):
+    def test_offset_table_size(self, testdata_wsa_files, wsa_info_json):
         """Test offset table has NumFrames + 2 entries."""
         if not testdata_wsa_files:
             pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
+        data, result = wsa_info_json(testdata_wsa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # Frame count should be positive - offset table parsed correctly
         frames = data.get("frames", 0)
         assert frames > 0
@@ -125,59 +126,32 @@ class TestWsaLoopFrame:
         result.assert_success()
 
 
+@pytest.mark.xdist_group(name="wsa_export")
 class TestWsaFrameDecoding:
     """Test frame decoding (Format40 + LCW)."""
 
-    def test_first_frame_decode(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_first_frame_decode(self, wsa_decoded_outputs):
         """Test decoding first frame."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
         # Export frames tests decoding
-        result = run(
-            wsa_tool, "export", "--frames", "-p", testdata_pal_files[0],
-            testdata_wsa_files[0], "-o", str(temp_dir / "frame.png")
-        )
-        result.assert_success()
-        png_files = list(temp_dir.glob("*.png"))
-        assert len(png_files) >= 1
+        out_dir, _ = wsa_decoded_outputs
+        assert next(out_dir.glob("*.png"), None) is not None
 
-    def test_delta_frame_decode(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_delta_frame_decode(self, wsa_decoded_outputs):
         """Test decoding delta frame (XOR against previous)."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        # Export all frames - delta frames depend on previous
-        result = run(
-            wsa_tool, "export", "--frames", "-p", testdata_pal_files[0],
-            testdata_wsa_files[0], "-o", str(temp_dir / "frame.png")
-        )
-        result.assert_success()
+        # Exporting all frames succeeded - delta frames depend on previous
+        out_dir, _ = wsa_decoded_outputs
+        assert all(p.stat().st_size > 0 for p in out_dir.glob("*.png"))
 
-    def test_cumulative_decoding(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_cumulative_decoding(self, wsa_decoded_outputs):
         """Test cumulative frame buffer updates."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
         # Export as GIF tests cumulative frame updates
-        result = run(wsa_tool, "export", "-p", testdata_pal_files[0],
-                    testdata_wsa_files[0], "-o", str(temp_dir / "anim.gif"))
-        result.assert_success()
-        gif_file = temp_dir / "anim.gif"
+        _, gif_file = wsa_decoded_outputs
         assert gif_file.exists()
-        data = gif_file.read_bytes()
-        assert data[:6] == b"GIF89a"
+        with gif_file.open("rb") as f:
+            assert f.read(6) == b"GIF89a"
 
 
+@pytest.mark.xdist_group(name="wsa_info")
 class TestWsaInfoOutput:
     """Test wsa-tool info command output."""
 
@@ -189,24 +163,20 @@ class TestWsaInfoOutput:
         result.assert_success()
         assert len(result.stdout_text) > 0
 
-    def test_info_json(self, wsa_tool, testdata_wsa_files, run):
+    def test_info_json(self, testdata_wsa_files, wsa_info_json):
         """Test JSON info output format."""
         if not testdata_wsa_files:
             pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
+        data, result = wsa_info_json(testdata_wsa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         assert isinstance(data, dict)
 
-    def test_info_fields_complete(self, wsa_tool, testdata_wsa_files, run):
+    def test_info_fields_complete(self, testdata_wsa_files, wsa_info_json):
         """Test all required info fields are present."""
         if not testdata_wsa_files:
             pytest.skip("No WSA files in testdata")
-        result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
+        data, result = wsa_info_json(testdata_wsa_files[0])
         result.assert_success()
-        import json
-        data = json.loads(result.stdout_text)
         # Check for key fields
         assert any(k in data for k in ["frames", "frameCount", "numFrames"])
         assert any(k in data for k in ["width", "Width"])
@@ -25,20 +25,27 @@ FIXTURES = Path(os.environ.get("FIXTURES", "fixtures"))
 # ---------------------------------------------------------------------------
 
 def run_mix(*args):
-    """Run mix-tool with args, return (stdout, stderr, returncode)."""
+    """Run mix-tool with args, return (stdout, stderr, returncode) as bytes."""
     result = subprocess.run(
         [MIX_TOOL] + list(args),
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     return result.stdout, result.stderr, result.returncode
 
 
+def require_files(*paths):
+    """Skip the calling class unless every testdata path exists."""
+    for path in paths:
+        if not path.exists():
+            raise unittest.SkipTest(f"{path} not found")
+
+
 def load_lib():
     """Load libmix shared library, return ctypes handle or None."""
     if not os.path.exists(MIX_LIB):
         return None
-    return ctypes.CDLL(MIX_LIB)
+    # Bind every symbol at load so the first call in a test pays no lookup
+    return ctypes.CDLL(MIX_LIB, mode=os.RTLD_NOW)
 
 
 # ---------------------------------------------------------------------------
@@ -51,32 +58,32 @@ class TestCLIBasic(unittest.TestCase):
     def test_help(self):
         out, err, code = run_mix("--help")
         self.assertEqual(code, 0)
-        self.assertIn("Usage:", out + err)
+        self.assertIn(b"Usage:", out + err)
 
     def test_version(self):
         out, err, code = run_mix("--version")
         self.assertEqual(code, 0)
-        self.assertIn("0.1.0", out + err)
+        self.assertIn(b"0.1.0", out + err)
 
     def test_list_help(self):
         out, err, code = run_mix("list", "--help")
         self.assertEqual(code, 0)
-        self.assertIn("--tree", out + err)
+        self.assertIn(b"--tree", out + err)
 
     def test_unknown_command(self):
         _, err, code = run_mix("badcmd")
         self.assertEqual(code, 2)
-        self.assertIn("unknown command", err)
+        self.assertIn(b"unknown command", err)
 
     def test_unknown_option(self):
         _, err, code = run_mix("list", "--badopt", "x.mix")
         self.assertEqual(code, 2)
-        self.assertIn("unknown option", err)
+        self.assertIn(b"unknown option", err)
 
     def test_missing_file_arg(self):
         _, err, code = run_mix("list")
         self.assertEqual(code, 2)
-        self.assertIn("missing file", err)
+        self.assertIn(b"missing file", err)
 
 
 class TestCLIFileErrors(unittest.TestCase):
@@ -85,7 +92,7 @@ class TestCLIFileErrors(unittest.TestCase):
     def test_file_not_found(self):
         _, err, code = run_mix("list", "/nonexistent.mix")
         self.assertEqual(code, 1)
-        self.assertIn("Cannot open", err)
+        self.assertIn(b"Cannot open", err)
 
 
 class TestCLITDFormat(unittest.TestCase):
@@ -95,41 +102,42 @@ class TestCLITDFormat(unittest.TestCase):
     def setUpClass(cls):
         cls.aud = TESTDATA / "mix" / "cd1_setup_aud.mix"
         cls.setup = TESTDATA / "mix" / "cd1_setup_setup.mix"
+        require_files(cls.aud, cls.setup)
 
     def test_aud_table(self):
         """List should output hash entries."""
         out, _, code = run_mix("list", str(self.aud))
         self.assertEqual(code, 0)
         # Should contain hash entries
-        self.assertIn("0x", out)
+        self.assertIn(b"0x", out)
         # Should have header
-        self.assertIn("Hash", out)
+        self.assertIn(b"Hash", out)
 
     def test_setup_table(self):
         """Setup mix should list entries."""
         out, _, code = run_mix("list", str(self.setup))
         self.assertEqual(code, 0)
-        self.assertIn("0x", out)
+        self.assertIn(b"0x", out)
 
     def test_aud_tree(self):
         out, _, code = run_mix("list", "--tree", str(self.aud))
         self.assertEqual(code, 0)
-        self.assertIn("├──", out)
-        self.assertIn("└──", out)
+        self.assertIn("├──".encode(), out)
+        self.assertIn("└──".encode(), out)
 
     def test_aud_info(self):
         """Info command should show format details."""
         out, _, code = run_mix("info", str(self.aud))
         self.assertEqual(code, 0)
-        self.assertIn("TD", out)
-        self.assertIn("47", out)  # file count
-        self.assertIn("Encrypted:   no", out)
+        self.assertIn(b"TD", out)
+        self.assertIn(b"47", out)  # file count
+        self.assertIn(b"Encrypted:   no", out)
 
     def test_setup_info(self):
         """Setup info should show 71 files."""
         out, _, code = run_mix("info", str(self.setup))
         self.assertEqual(code, 0)
-        self.assertIn("71", out)
+        self.assertIn(b"71", out)
 
 
 class TestCLIRAFormat(unittest.TestCase):
@@ -139,20 +147,21 @@ class TestCLIRAFormat(unittest.TestCase):
     def setUpClass(cls):
         cls.redalert = TESTDATA / "mix" / "cd1_install_redalert.mix"
         cls.main = TESTDATA / "mix" / "cd1_main.mix"
+        require_files(cls.redalert, cls.main)
 
     def test_encrypted_supported(self):
         """Encrypted RA format should be parsed successfully."""
         out, err, code = run_mix("list", str(self.redalert))
         self.assertEqual(code, 0)
         # Should produce some output (hash entries)
-        self.assertIn("0x", out)
+        self.assertIn(b"0x", out)
 
     def test_encrypted_info(self):
         """Info command should report encrypted status."""
         out, _, code = run_mix("info", str(self.main))
         self.assertEqual(code, 0)
-        self.assertIn("Encrypted:   yes", out)
-        self.assertIn("RA", out)
+        self.assertIn(b"Encrypted:   yes", out)
+        self.assertIn(b"RA", out)
 
 
 class TestCLINameResolution(unittest.TestCase):
@@ -162,6 +171,7 @@ class TestCLINameResolution(unittest.TestCase):
     def setUpClass(cls):
         cls.aud = TESTDATA / "mix" / "cd1_setup_aud.mix"
         cls.names_file = FIXTURES / "names.txt"
+        require_files(cls.aud)
 
     def test_names_option(self):
         """The -n/--names option should accept a filename database."""
@@ -183,11 +193,25 @@ class TestCAPI(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
+        cls.reader = ctypes.c_void_p()
         cls.lib = load_lib()
         if cls.lib is None:
             raise unittest.SkipTest("libmix.dylib not found")
         cls._setup_ctypes()
         cls.aud = TESTDATA / "mix" / "cd1_setup_aud.mix"
+        require_files(cls.aud)
+        cls.aud_path = str(cls.aud).encode()
+        err = cls.lib.mix_reader_open(cls.aud_path, ctypes.byref(cls.reader))
+        if err != 0:
+            raise RuntimeError(
+                f"mix_reader_open({cls.aud}) failed: "
+                f"{cls.lib.mix_error_string(err).decode()}"
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.reader.value:
+            cls.lib.mix_reader_free(cls.reader)
 
     @classmethod
     def _setup_ctypes(cls):
@@ -212,23 +236,14 @@ class TestCAPI(unittest.TestCase):
 
     def test_open_close(self):
         reader = ctypes.c_void_p()
-        err = self.lib.mix_reader_open(
-            str(self.aud).encode(),
-            ctypes.byref(reader)
-        )
+        err = self.lib.mix_reader_open(self.aud_path, ctypes.byref(reader))
         self.assertEqual(err, 0)
         self.assertIsNotNone(reader.value)
         self.lib.mix_reader_free(reader)
 
     def test_count(self):
-        reader = ctypes.c_void_p()
-        self.lib.mix_reader_open(
-            str(self.aud).encode(),
-            ctypes.byref(reader)
-        )
-        count = self.lib.mix_reader_count(reader)
+        count = self.lib.mix_reader_count(self.reader)
         self.assertEqual(count, 47)
-        self.lib.mix_reader_free(reader)
 
     def test_error_string(self):
         msg = self.lib.mix_error_string(1).decode()
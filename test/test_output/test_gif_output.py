@@ -14,30 +14,88 @@ import struct
 from pathlib import Path
 
 
+def parse_gif(data) -> dict:
+    """Walk a GIF's blocks and summarize the fields the tests check.
+
+    data may be bytes or any sliceable buffer such as an mmap.
+    """
+    width, height, packed = struct.unpack_from("<HHB", data, 6)
+    gct_flag = bool(packed & 0x80)
+    gct_size = 2 ** ((packed & 0x07) + 1)
+    info = {
+        "width": width,
+        "height": height,
+        "packed": packed,
+        "gct_flag": gct_flag,
+        "gct_size": gct_size,
+        "frame_count": 0,
+        "gce_count": 0,
+        "trailer": data[-1] == 0x3B,
+        "has_netscape": False,
+        "loop_count": None,
+    }
+
+    def skip_sub_blocks(pos):
+        while data[pos]:
+            pos += data[pos] + 1
+        return pos + 1
+
+    pos = 13 + (3 * gct_size if gct_flag else 0)
+    while pos < len(data) and data[pos] != 0x3B:
+        if data[pos] == 0x21:  # Extension
+            label = data[pos + 1]
+            if label == 0xF9:
+                info["gce_count"] += 1
+            elif label == 0xFF and data[pos + 3:pos + 14] == b"NETSCAPE2.0":
+                info["has_netscape"] = True
+                # Sub-block: length 3, id 1, little-endian loop count
+                info["loop_count"] = struct.unpack_from(
+                    "<H", data, pos + 16
+                )[0]
+            pos = skip_sub_blocks(pos + 2)
+        elif data[pos] == 0x2C:  # Image descriptor
+            info["frame_count"] += 1
+            local = data[pos + 9]
+            pos += 10
+            if local & 0x80:
+                pos += 3 * 2 ** ((local & 0x07) + 1)
+            pos = skip_sub_blocks(pos + 1)  # skip LZW minimum code size
+        else:
+            break
+    return info
+
+
+@pytest.fixture(scope="session")
+def exported_gif(wsa_tool, wsa_sources, run, tmp_path_factory, mapped_file):
+    """Export the first testdata WSA to GIF once.
+
+    Yields (out_path, data, header): data is a read-only mmap of the file
+    and header is parse_gif(data).
+    """
+    pal, wsa = wsa_sources
+    out_file = tmp_path_factory.mktemp("gif") / "test.gif"
+    result = run(
+        wsa_tool,
+        "export",
+        "-p",
+        pal,
+        wsa,
+        "-o",
+        str(out_file),
+    )
+    if result.returncode != 0:
+        pytest.skip("Export not implemented")
+    with mapped_file(out_file) as data:
+        yield out_file, data, parse_gif(data)
+
+
+@pytest.mark.xdist_group(name="gif_export")
 class TestGifSignature:
     """Test GIF file signature."""
 
-    def test_gif_signature_89a(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_gif_signature_89a(self, exported_gif):
         """Test GIF89a signature."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
+        _, data, _ = exported_gif
         assert data[:6] == b"GIF89a"
 
     def test_gif_version(self):
@@ -47,71 +105,21 @@ class TestGifSignature:
         assert gif89a[3:6] == b"89a"
 
 
+@pytest.mark.xdist_group(name="gif_export")
 class TestGifDimensions:
     """Test GIF canvas dimensions."""
 
-    def test_logical_screen_width(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_logical_screen_width(self, exported_gif, wsa_info):
         """Test logical screen width."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        # Get source dimensions
-        info_result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
-        source_width = info.get("width") or info.get("Width")
+        _, _, header = exported_gif
+        source_width = wsa_info.get("width") or wsa_info.get("Width")
+        assert header["width"] == source_width
 
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        gif_width = struct.unpack("<H", data[6:8])[0]
-        assert gif_width == source_width
-
-    def test_logical_screen_height(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_logical_screen_height(self, exported_gif, wsa_info):
         """Test logical screen height."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        info_result = run(wsa_tool, "info", "--json", testdata_wsa_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
-        source_height = info.get("height") or info.get("Height")
-
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        gif_height = struct.unpack("<H", data[8:10])[0]
-        assert gif_height == source_height
+        _, _, header = exported_gif
+        source_height = wsa_info.get("height") or wsa_info.get("Height")
+        assert header["height"] == source_height
 
 
 class TestGifFrameTiming:
@@ -123,29 +131,21 @@ class TestGifFrameTiming:
         delay_cs = round(100 / fps)
         assert delay_cs == 7  # 100/15 = 6.67, rounds to 7
 
-    def test_delay_calculation(self):
+    @pytest.mark.parametrize("fps,expected_delay", [
+        (10, 10),   # 100/10 = 10
+        (15, 7),    # 100/15 = 6.67 -> 7
+        (20, 5),    # 100/20 = 5
+        (24, 4),    # 100/24 = 4.17 -> 4
+        (25, 4),    # 100/25 = 4
+        (30, 3),    # 100/30 = 3.33 -> 3
+    ])
+    def test_delay_calculation(self, fps, expected_delay):
         """Test delay = round(100 / fps) centiseconds."""
-        test_cases = [
-            (10, 10),   # 100/10 = 10
-            (15, 7),    # 100/15 = 6.67 -> 7
-            (20, 5),    # 100/20 = 5
-            (24, 4),    # 100/24 = 4.17 -> 4
-            (25, 4),    # 100/25 = 4
-            (30, 3),    # 100/30 = 3.33 -> 3
-        ]
-        for fps, expected_delay in test_cases:
-            actual = round(100 / fps)
-            expected_msg = f"FPS {fps}: expected {expected_delay}, got {actual}"
-            assert actual == expected_delay, expected_msg
-
-    def test_custom_fps_option(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+        assert round(100 / fps) == expected_delay
+
+    def test_custom_fps_option(self, wsa_tool, wsa_sources, run, temp_dir):
         """Test --fps option affects timing."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
+        pal, wsa = wsa_sources
         out_file = temp_dir / "test.gif"
         result = run(
             wsa_tool,
@@ -153,8 +153,8 @@ class TestGifFrameTiming:
             "--fps",
             "10",
             "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
+            pal,
+            wsa,
             "-o",
             str(out_file),
         )
@@ -164,80 +164,54 @@ class TestGifFrameTiming:
         assert out_file.exists()
 
 
+@pytest.mark.xdist_group(name="gif_export")
 class TestGifLooping:
     """Test GIF looping behavior."""
 
-    def test_netscape_extension_present(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_netscape_extension_present(self, exported_gif):
         """Test NETSCAPE2.0 extension for looping."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        # NETSCAPE2.0 extension marker
-        assert b"NETSCAPE2.0" in data or b"NETSCAPE" in data
+        _, _, header = exported_gif
+        assert header["has_netscape"]
 
-    def test_loop_infinite_default(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_loop_infinite_default(self, wsa_tool, wsa_sources, run, temp_dir):
         """Test default is infinite loop (count=0)."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
+        pal, wsa = wsa_sources
         out_file = temp_dir / "test.gif"
         result = run(
             wsa_tool,
             "export",
             "--loop",
             "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
+            pal,
+            wsa,
             "-o",
             str(out_file),
         )
         if result.returncode != 0:
             pytest.skip("Export not implemented")
         # Loop count 0 = infinite
-        assert out_file.exists()
+        header = parse_gif(out_file.read_bytes())
+        assert header["loop_count"] == 0
 
-    def test_no_loop_option(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_no_loop_option(self, wsa_tool, wsa_sources, run, temp_dir):
         """Test --no-loop produces single-play GIF."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
+        pal, wsa = wsa_sources
         out_file = temp_dir / "test.gif"
         result = run(
             wsa_tool,
             "export",
             "--no-loop",
             "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
+            pal,
+            wsa,
             "-o",
             str(out_file),
         )
         if result.returncode != 0:
             pytest.skip("Export not implemented")
         # No NETSCAPE extension or loop count = 1
-        assert out_file.exists()
+        header = parse_gif(out_file.read_bytes())
+        assert not header["has_netscape"] or header["loop_count"] == 1
 
 
 class TestGifTransparency:
@@ -274,138 +248,40 @@ class TestGifTransparency:
         assert transparent_index == 0
 
 
+@pytest.mark.xdist_group(name="gif_export")
 class TestGifColorTable:
     """Test GIF color table."""
 
-    def test_global_color_table_present(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_global_color_table_present(self, exported_gif):
         """Test global color table is present."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
+        _, _, header = exported_gif
         # Packed byte at offset 10, bit 7 = global color table flag
-        packed = data[10]
-        has_gct = (packed & 0x80) != 0
-        assert has_gct
+        assert header["gct_flag"]
 
-    def test_color_table_size(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_color_table_size(self, exported_gif):
         """Test color table has 256 entries."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
+        _, _, header = exported_gif
         # Size bits 0-2 of packed byte, actual size = 2^(N+1)
-        packed = data[10]
-        size_bits = packed & 0x07
-        table_size = 2 ** (size_bits + 1)
-        assert table_size == 256
+        assert header["gct_size"] == 256
 
 
+@pytest.mark.xdist_group(name="gif_export")
 class TestGifAnimation:
     """Test GIF animation structure."""
 
-    def test_multiple_frames(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+    def test_multiple_frames(self, exported_gif):
         """Test animated GIF has multiple image blocks."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        # Count image descriptors (0x2C marker)
-        frame_count = data.count(b",")  # 0x2C = ','
-        # Should have at least one frame
-        assert frame_count >= 1
-
-    def test_graphic_control_extension(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+        _, _, header = exported_gif
+        # Should have at least one image descriptor (0x2C)
+        assert header["frame_count"] >= 1
+
+    def test_graphic_control_extension(self, exported_gif):
         """Test graphic control extension for each frame."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        # GCE marker is 0x21 0xF9
-        gce_marker = bytes([0x21, 0xF9])
-        gce_count = data.count(gce_marker)
-        # Each animated frame should have GCE
-        assert gce_count >= 1
-
-    def test_trailer_present(
-        self, wsa_tool, testdata_wsa_files, testdata_pal_files, run, temp_dir
-    ):
+        _, _, header = exported_gif
+        # Each animated frame should have a GCE (0x21 0xF9)
+        assert header["gce_count"] >= 1
+
+    def test_trailer_present(self, exported_gif):
         """Test GIF trailer (0x3B) terminates file."""
-        if not testdata_wsa_files:
-            pytest.skip("No WSA files in testdata")
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "test.gif"
-        result = run(
-            wsa_tool,
-            "export",
-            "-p",
-            testdata_pal_files[0],
-            testdata_wsa_files[0],
-            "-o",
-            str(out_file),
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        assert data[-1] == 0x3B  # GIF trailer
+        _, _, header = exported_gif
+        assert header["trailer"]  # GIF trailer
\ No newline at end of file
@@ -9,97 +9,71 @@ Tests cover:
 """
 
 import pytest
-import json
 
 
-class TestJsonValidity:
-    """Test JSON output is valid."""
+def normalized_keys(data) -> set[str]:
+    """All keys in a JSON document, nested included, lower-cased without _."""
+    keys = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            keys.update(k.lower().replace("_", "") for k in node)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return keys
 
-    def test_aud_info_valid_json(self, aud_tool, testdata_aud_files, run):
-        """Test aud-tool info --json produces valid JSON."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        assert isinstance(data, dict)
 
-    def test_shp_info_valid_json(self, shp_tool, testdata_shp_files, run):
-        """Test shp-tool info --json produces valid JSON."""
-        if not testdata_shp_files:
-            pytest.skip("No SHP files in testdata")
-        result = run(shp_tool, "info", "--json", testdata_shp_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        assert isinstance(data, dict)
+def lookup(data: dict, *names):
+    """Value of the first of names present, ignoring case and underscores."""
+    view = {k.lower().replace("_", ""): v for k, v in data.items()}
+    for name in names:
+        key = name.lower().replace("_", "")
+        if key in view:
+            return view[key]
+    return None
 
-    def test_pal_info_valid_json(self, pal_tool, testdata_pal_files, run):
-        """Test pal-tool info --json produces valid JSON."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        result = run(pal_tool, "info", "--json", testdata_pal_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        assert isinstance(data, dict)
 
-    def test_vqa_info_valid_json(self, vqa_tool, testdata_vqa_files, run):
-        """Test vqa-tool info --json produces valid JSON."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+class TestJsonValidity:
+    """Test JSON output is valid."""
+
+    @pytest.mark.parametrize(
+        "info", ["aud_info", "shp_info", "pal_info", "vqa_info"]
+    )
+    def test_info_valid_json(self, info, request):
+        """Test each tool's info --json produces a JSON object."""
+        data = request.getfixturevalue(info)
         assert isinstance(data, dict)
 
 
+@pytest.mark.xdist_group(name="aud_info")
 class TestAudJsonFields:
     """Test aud-tool JSON output fields."""
 
-    def test_required_fields(self, aud_tool, testdata_aud_files, run):
+    def test_required_fields(self, aud_info):
         """Test all required fields are present."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+        data = aud_info
 
         # Required fields per spec
         required = [
             "sample_rate", "channels", "bits", "codec",
             "compressed_size", "uncompressed_size", "duration"
         ]
+        keys = normalized_keys(data)
         for field in required:
-            field_present = (
-                field in data or
-                field.replace("_", "") in str(data).lower()
-            )
-            assert field_present, f"Missing field: {field}"
+            assert field.replace("_", "") in keys, f"Missing field: {field}"
 
-    def test_sample_rate_type(self, aud_tool, testdata_aud_files, run):
+    def test_sample_rate_type(self, aud_info):
         """Test sample_rate is integer."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        rate = data.get("sample_rate") or data.get("SampleRate")
+        data = aud_info
+        rate = lookup(data, "sample_rate")
         assert isinstance(rate, int)
 
-    def test_codec_values(self, aud_tool, testdata_aud_files, run):
+    def test_codec_values(self, aud_info):
         """Test codec is valid value."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        codec = data.get("codec") or data.get("Codec")
+        data = aud_info
+        codec = lookup(data, "codec")
         valid_codecs = [
             "westwood_adpcm", "ima_adpcm",
             "WestwoodADPCM", "IMA_ADPCM"
@@ -107,125 +81,82 @@ class TestAudJsonFields:
         assert codec in valid_codecs or "adpcm" in str(codec).lower()
 
 
+@pytest.mark.xdist_group(name="shp_info")
 class TestShpJsonFields:
     """Test shp-tool JSON output fields."""
 
-    def test_required_fields(self, shp_tool, testdata_shp_files, run):
+    def test_required_fields(self, shp_info):
         """Test all required fields are present."""
-        if not testdata_shp_files:
-            pytest.skip("No SHP files in testdata")
-        result = run(shp_tool, "info", "--json", testdata_shp_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+        data = shp_info
 
         # Required fields
         required = ["frames", "width", "height", "format"]
+        keys = normalized_keys(data)
         for field in required:
-            field_present = (
-                field in data or
-                field.replace("_", "") in str(data).lower()
-            )
-            assert field_present, f"Missing field: {field}"
+            assert field.replace("_", "") in keys, f"Missing field: {field}"
 
-    def test_frames_is_integer(self, shp_tool, testdata_shp_files, run):
+    def test_frames_is_integer(self, shp_info):
         """Test frames count is integer."""
-        if not testdata_shp_files:
-            pytest.skip("No SHP files in testdata")
-        result = run(shp_tool, "info", "--json", testdata_shp_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        frames = (
-            data.get("frames") or data.get("Frames") or
-            data.get("frame_count")
-        )
+        data = shp_info
+        frames = lookup(data, "frames", "frame_count")
         assert isinstance(frames, int)
         assert frames > 0
 
 
+@pytest.mark.xdist_group(name="pal_info")
 class TestPalJsonFields:
     """Test pal-tool JSON output fields."""
 
-    def test_required_fields(self, pal_tool, testdata_pal_files, run):
+    def test_required_fields(self, pal_info):
         """Test all required fields are present."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        result = run(pal_tool, "info", "--json", testdata_pal_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+        data = pal_info
 
         # Required fields
         required = ["format", "colors", "bit_depth"]
+        keys = normalized_keys(data)
         for field in required:
-            field_present = (
-                field in data or
-                field.replace("_", "") in str(data).lower()
-            )
-            assert field_present, f"Missing field: {field}"
+            assert field.replace("_", "") in keys, f"Missing field: {field}"
 
-    def test_colors_is_256(self, pal_tool, testdata_pal_files, run):
+    def test_colors_is_256(self, pal_info):
         """Test palette has 256 colors."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        result = run(pal_tool, "info", "--json", testdata_pal_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-        colors = (
-            data.get("colors") or data.get("Colors") or
-            data.get("color_count")
-        )
+        data = pal_info
+        colors = lookup(data, "colors", "color_count")
         assert colors == 256
 
 
+@pytest.mark.xdist_group(name="vqa_info")
 class TestVqaJsonFields:
     """Test vqa-tool JSON output fields."""
 
-    def test_video_fields(self, vqa_tool, testdata_vqa_files, run):
+    def test_video_fields(self, vqa_info):
         """Test video-related fields are present."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+        data = vqa_info
 
         # Video fields
         video_fields = ["version", "width", "height", "frames", "frame_rate"]
-        found = 0
-        for field in video_fields:
-            if field in data or field.replace("_", "") in str(data).lower():
-                found += 1
+        keys = normalized_keys(data)
+        found = sum(f.replace("_", "") in keys for f in video_fields)
         assert found >= 3, "Missing video fields"
 
-    def test_audio_fields(self, vqa_tool, testdata_vqa_files, run):
+    def test_audio_fields(self, vqa_info):
         """Test audio-related fields are present."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
+        data = vqa_info
 
         # May have has_audio or audio section
-        has_audio_info = ("has_audio" in str(data).lower() or
-                         "audio" in str(data).lower() or
-                         "sample_rate" in str(data).lower())
-        assert has_audio_info
+        keys = normalized_keys(data)
+        assert keys & {"hasaudio", "audio", "samplerate"}
 
 
 class TestFntJsonFields:
     """Test fnt-tool JSON output fields."""
 
+    @pytest.mark.skip(reason="Requires extracted FNT test files")
     def test_required_fields(self, fnt_tool, run):
         """Test all required fields are present."""
-        pytest.skip("Requires extracted FNT test files")
 
+    @pytest.mark.skip(reason="Requires extracted FNT test files")
     def test_glyphs_object(self, fnt_tool, run):
         """Test glyphs is object with character keys."""
-        pytest.skip("Requires extracted FNT test files")
 
 
 class TestJsonNaming:
@@ -238,22 +169,19 @@ class TestJsonNaming:
         for name in valid_names:
             assert "_" in name or name.islower()
 
-    def test_no_mixed_conventions(self, aud_tool, testdata_aud_files, run):
+    def test_no_mixed_conventions(self, aud_info):
         """Test no mixing of camelCase and snake_case."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if result.returncode != 0:
-            pytest.skip("JSON output not implemented")
-        data = json.loads(result.stdout_text)
-
-        # Check for consistent naming
-        keys = list(data.keys())
-        has_snake = any("_" in k for k in keys)
-        has_camel = any(
-            k[0].islower() and any(c.isupper() for c in k[1:])
-            for k in keys
-        )
+        data = aud_info
+
+        # Check for consistent naming; stop once both styles are seen
+        has_snake = has_camel = False
+        for k in data:
+            has_snake = has_snake or "_" in k
+            has_camel = has_camel or (
+                k[:1].islower() and any(c.isupper() for c in k[1:])
+            )
+            if has_snake and has_camel:
+                break
         # Should not have both (unless intentional)
         # This is a soft check - some tools may use different conventions
 
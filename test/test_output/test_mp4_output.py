@@ -10,83 +10,91 @@ Tests cover:
 """
 
 import pytest
+import shutil
+import struct
 import subprocess
 from pathlib import Path
 
-
+from conftest import parse_json
+
+FFPROBE = shutil.which("ffprobe")
+
+
+def mp4_boxes(path: Path):
+    """Yield top-level ISO BMFF box types, seeking past each payload."""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return
+            size, box_type = struct.unpack(">I4s", header)
+            yield box_type
+            if size == 1:  # 64-bit largesize follows the type
+                size = struct.unpack(">Q", f.read(8))[0] - 8
+            if size < 8:  # 0 = box runs to end of file
+                return
+            f.seek(size - 8, 1)
+
+
+@pytest.fixture(scope="session")
+def exported_mp4(vqa_tool, testdata_vqa_files, run, tmp_path_factory) -> Path:
+    """Export the first testdata VQA to MP4 once; returns the output path."""
+    if not testdata_vqa_files:
+        pytest.skip("No VQA files in testdata")
+    out_file = tmp_path_factory.mktemp("mp4") / "test.mp4"
+    result = run(
+        vqa_tool, "export", "--mp4",
+        testdata_vqa_files[0], "-o", str(out_file)
+    )
+    if result.returncode != 0:
+        pytest.skip("MP4 export not implemented")
+    return out_file
+
+
+@pytest.fixture(scope="session")
+def mp4_streams(exported_mp4) -> dict:
+    """ffprobe stream info for exported_mp4, first stream per codec_type."""
+    if FFPROBE is None:
+        pytest.skip("ffprobe not available")
+    probe = subprocess.run(
+        [FFPROBE, "-v", "error", "-print_format", "json",
+         "-show_streams", str(exported_mp4)],
+        capture_output=True
+    )
+    if probe.returncode != 0:
+        pytest.fail(f"ffprobe failed: {probe.stderr.decode(errors='replace')}")
+    streams = {}
+    for stream in parse_json(probe.stdout).get("streams", []):
+        streams.setdefault(stream.get("codec_type"), stream)
+    return streams
+
+
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4Container:
     """Test MP4 container structure."""
 
-    def test_ftyp_box(self, vqa_tool, testdata_vqa_files, run, temp_dir):
+    def test_ftyp_box(self, exported_mp4):
         """Test ftyp box is present (MP4 signature)."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-        data = out_file.read_bytes()
-        # ftyp box should be near start
-        assert b"ftyp" in data[:32]
+        # ftyp box should be first
+        assert next(mp4_boxes(exported_mp4), None) == b"ftyp"
 
-    def test_moov_box(self, vqa_tool, testdata_vqa_files, run, temp_dir):
+    def test_moov_box(self, exported_mp4):
         """Test moov box (metadata) is present."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-        data = out_file.read_bytes()
-        assert b"moov" in data
+        assert b"moov" in mp4_boxes(exported_mp4)
 
-    def test_mdat_box(self, vqa_tool, testdata_vqa_files, run, temp_dir):
+    def test_mdat_box(self, exported_mp4):
         """Test mdat box (media data) is present."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-        data = out_file.read_bytes()
-        assert b"mdat" in data
+        assert b"mdat" in mp4_boxes(exported_mp4)
 
 
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4VideoCodec:
     """Test H.264 video encoding."""
 
-    def test_h264_codec(self, vqa_tool, testdata_vqa_files, run, temp_dir):
+    def test_h264_codec(self, mp4_streams):
         """Test video stream uses H.264."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        # Use ffprobe to check codec
-        try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "v:0",
-                 "-show_entries", "stream=codec_name", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            assert "h264" in probe.stdout.lower()
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
+        assert "video" in mp4_streams
+        assert "h264" in mp4_streams["video"]["codec_name"].lower()
 
     def test_default_crf(self, vqa_tool, testdata_vqa_files, run, temp_dir):
         """Test default CRF is 18."""
@@ -117,32 +125,14 @@ class TestMp4VideoCodec:
             assert out_high.stat().st_size >= out_low.stat().st_size
 
 
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4AudioCodec:
     """Test AAC audio encoding."""
 
-    def test_aac_codec(self, vqa_tool, testdata_vqa_files, run, temp_dir):
+    def test_aac_codec(self, mp4_streams):
         """Test audio stream uses AAC."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        # Use ffprobe to check audio codec
-        try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "a:0",
-                 "-show_entries", "stream=codec_name", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            assert "aac" in probe.stdout.lower()
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
+        assert "audio" in mp4_streams
+        assert "aac" in mp4_streams["audio"]["codec_name"].lower()
 
     def test_audio_bitrate(self, vqa_tool, testdata_vqa_files, run, temp_dir):
         """Test AAC bitrate is 192kbps."""
@@ -151,186 +141,78 @@ class TestMp4AudioCodec:
         assert expected_bitrate == 192000
 
 
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4Dimensions:
     """Test video dimensions match source."""
 
-    def test_width_matches_source(
-        self, vqa_tool, testdata_vqa_files, run, temp_dir
-    ):
+    def test_width_matches_source(self, vqa_info, mp4_streams):
         """Test MP4 width matches VQA width."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-
-        # Get source dimensions
-        info_result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
         # VQA JSON has nested video.width structure
-        video = info.get("video", {})
+        video = vqa_info.get("video", {})
         source_width = (
-            video.get("width") or info.get("width") or info.get("Width")
+            video.get("width") or vqa_info.get("width") or
+            vqa_info.get("Width")
         )
+        assert "video" in mp4_streams
+        assert mp4_streams["video"]["width"] == source_width
 
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "v:0",
-                 "-show_entries", "stream=width", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            mp4_width = int(probe.stdout.strip())
-            assert mp4_width == source_width
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
-
-    def test_height_matches_source(
-        self, vqa_tool, testdata_vqa_files, run, temp_dir
-    ):
+    def test_height_matches_source(self, vqa_info, mp4_streams):
         """Test MP4 height matches VQA height."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-
-        info_result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
         # VQA JSON has nested video.height structure
-        video = info.get("video", {})
+        video = vqa_info.get("video", {})
         source_height = (
-            video.get("height") or info.get("height") or info.get("Height")
-        )
-
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
+            video.get("height") or vqa_info.get("height") or
+            vqa_info.get("Height")
         )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "v:0",
-                 "-show_entries", "stream=height", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            mp4_height = int(probe.stdout.strip())
-            assert mp4_height == source_height
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
+        assert "video" in mp4_streams
+        assert mp4_streams["video"]["height"] == source_height
 
 
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4FrameRate:
     """Test video frame rate."""
 
-    def test_framerate_preserved(
-        self, vqa_tool, testdata_vqa_files, run, temp_dir
-    ):
+    def test_framerate_preserved(self, vqa_info, mp4_streams):
         """Test frame rate matches VQA frame rate."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-
-        info_result = run(vqa_tool, "info", "--json", testdata_vqa_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
         # VQA JSON has nested video.frameRate structure
-        video = info.get("video", {})
+        video = vqa_info.get("video", {})
         source_fps = (
-            video.get("frameRate") or info.get("frame_rate") or
-            info.get("FrameRate") or info.get("fps")
+            video.get("frameRate") or vqa_info.get("frame_rate") or
+            vqa_info.get("FrameRate") or vqa_info.get("fps")
         )
 
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "v:0",
-                 "-show_entries", "stream=r_frame_rate", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            # Frame rate may be fraction like "15/1"
-            fps_str = probe.stdout.strip()
-            if "/" in fps_str:
-                num, den = fps_str.split("/")
-                mp4_fps = int(num) / int(den)
-            else:
-                mp4_fps = float(fps_str)
-            assert abs(mp4_fps - source_fps) < 0.1
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
+        # Frame rate may be fraction like "15/1"
+        assert "video" in mp4_streams
+        fps_str = mp4_streams["video"]["r_frame_rate"]
+        if "/" in fps_str:
+            num, den = fps_str.split("/")
+            mp4_fps = int(num) / int(den)
+        else:
+            mp4_fps = float(fps_str)
+        assert abs(mp4_fps - source_fps) < 0.1
 
 
+@pytest.mark.xdist_group(name="mp4_export")
 class TestMp4AudioSync:
     """Test audio/video synchronization."""
 
-    def test_av_duration_match(
-        self, vqa_tool, testdata_vqa_files, run, temp_dir
-    ):
+    def test_av_duration_match(self, mp4_streams):
         """Test audio and video have same duration."""
-        if not testdata_vqa_files:
-            pytest.skip("No VQA files in testdata")
-
-        out_file = temp_dir / "test.mp4"
-        result = run(
-            vqa_tool, "export", "--mp4",
-            testdata_vqa_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("MP4 export not implemented")
-
-        try:
-            # Get video duration
-            v_probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "v:0",
-                 "-show_entries", "stream=duration", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-            # Get audio duration
-            a_probe = subprocess.run(
-                ["ffprobe", "-v", "error", "-select_streams", "a:0",
-                 "-show_entries", "stream=duration", "-of", "csv=p=0",
-                 str(out_file)],
-                capture_output=True, text=True
-            )
-
-            if v_probe.stdout.strip() and a_probe.stdout.strip():
-                v_dur = float(v_probe.stdout.strip())
-                a_dur = float(a_probe.stdout.strip())
-                # Allow 0.1 second tolerance
-                assert abs(v_dur - a_dur) < 0.1
-        except FileNotFoundError:
-            pytest.skip("ffprobe not available")
+        assert "video" in mp4_streams
+        assert "audio" in mp4_streams
+        v_dur = float(mp4_streams["video"]["duration"])
+        a_dur = float(mp4_streams["audio"]["duration"])
+        # Allow 0.1 second tolerance
+        assert abs(v_dur - a_dur) < 0.1
 
 
 class TestMp4NoAudio:
     """Test MP4 without audio track."""
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_video_only_vqa(self):
         """Test MP4 from video-only VQA has no audio stream."""
-        pytest.skip("Requires video-only VQA test file")
 
+    @pytest.mark.skip(reason="Requires video-only VQA test file")
     def test_video_only_valid(self):
         """Test video-only MP4 is still valid."""
-        pytest.skip("Requires video-only VQA test file")
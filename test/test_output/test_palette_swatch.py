@@ -13,51 +13,49 @@ import struct
 from pathlib import Path
 
 
+@pytest.fixture(scope="session")
+def pal_swatch(pal_tool, testdata_pal_files, run, tmp_path_factory) -> dict:
+    """Export the first testdata PAL swatch once and parse its IHDR.
+
+    Only the signature and IHDR chunk (the first 33 bytes) are read.
+    """
+    if not testdata_pal_files:
+        pytest.skip("No PAL files in testdata")
+    out_file = tmp_path_factory.mktemp("swatch") / "swatch.png"
+    result = run(
+        pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
+    )
+    if result.returncode != 0:
+        pytest.skip("Export not implemented")
+    with open(out_file, "rb", buffering=0) as f:  # one 33-byte read(2)
+        header = f.read(33)
+    sig, _, chunk_type, width, height, bit_depth, color_type = \
+        struct.unpack_from(">8sI4sIIBB", header)
+    return {
+        "sig": sig,
+        "chunk_type": chunk_type,
+        "width": width,
+        "height": height,
+        "bit_depth": bit_depth,
+        "color_type": color_type,
+    }
+
+
+@pytest.mark.xdist_group(name="pal_swatch")
 class TestSwatchDimensions:
     """Test swatch image dimensions."""
 
-    def test_width_512(self, pal_tool, testdata_pal_files, run, temp_dir):
+    def test_width_512(self, pal_swatch):
         """Test swatch width is 512 pixels."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        width = struct.unpack(">I", data[16:20])[0]
-        assert width == 512
-
-    def test_height_512(self, pal_tool, testdata_pal_files, run, temp_dir):
+        assert pal_swatch["width"] == 512
+
+    def test_height_512(self, pal_swatch):
         """Test swatch height is 512 pixels."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        height = struct.unpack(">I", data[20:24])[0]
-        assert height == 512
-
-    def test_square_image(self, pal_tool, testdata_pal_files, run, temp_dir):
+        assert pal_swatch["height"] == 512
+
+    def test_square_image(self, pal_swatch):
         """Test swatch is square."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        width = struct.unpack(">I", data[16:20])[0]
-        height = struct.unpack(">I", data[20:24])[0]
-        assert width == height
+        assert pal_swatch["width"] == pal_swatch["height"]
 
 
 class TestSwatchGrid:
@@ -95,88 +93,59 @@ class TestSwatchGrid:
 class TestSwatchColors:
     """Test color accuracy in swatch."""
 
-    def test_6bit_to_8bit_conversion(self):
+    def test_6bit_to_8bit_conversion(self, lut_6to8):
         """Test correct 6-bit to 8-bit conversion."""
-        def convert(val6):
-            return (val6 << 2) | (val6 >> 4)
-
         # Test corner cases
-        assert convert(0) == 0
-        assert convert(63) == 255
+        assert lut_6to8[0] == 0
+        assert lut_6to8[63] == 255
 
         # Test intermediate
-        assert convert(32) == 130
+        assert lut_6to8[32] == 130
+
+        # Whole 6-bit range is strictly increasing
+        assert all(a < b for a, b in zip(lut_6to8, lut_6to8[1:]))
 
+    @pytest.mark.skip(reason="Requires image parsing")
     def test_black_at_index_0(self):
         """Test index 0 typically contains black or transparent."""
         # Red Alert convention: index 0 is often transparent
         # When rendered, should appear as black (0,0,0)
-        pytest.skip("Requires image parsing")
 
+    @pytest.mark.skip(reason="Requires image parsing")
     def test_uniform_swatch_fill(self):
         """Test each swatch cell is uniform color."""
         # All 32x32 pixels in each cell should be same color
-        pytest.skip("Requires image parsing")
 
 
+@pytest.mark.xdist_group(name="pal_swatch")
 class TestSwatchFormat:
     """Test swatch output format."""
 
-    def test_png_format(self, pal_tool, testdata_pal_files, run, temp_dir):
+    def test_png_format(self, pal_swatch):
         """Test swatch is valid PNG."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
         png_sig = bytes([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A])
-        assert data[:8] == png_sig
+        assert pal_swatch["sig"] == png_sig
+        assert pal_swatch["chunk_type"] == b"IHDR"
 
-    def test_rgb_not_rgba(self, pal_tool, testdata_pal_files, run, temp_dir):
+    def test_rgb_not_rgba(self, pal_swatch):
         """Test swatch uses RGB (no alpha needed for solid swatches)."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        color_type = data[25]
         # RGB = 2, RGBA = 6 (both acceptable)
-        assert color_type in [2, 6]
+        assert pal_swatch["color_type"] in [2, 6]
 
-    def test_8bit_per_channel(
-        self, pal_tool, testdata_pal_files, run, temp_dir
-    ):
+    def test_8bit_per_channel(self, pal_swatch):
         """Test 8-bit per color channel."""
-        if not testdata_pal_files:
-            pytest.skip("No PAL files in testdata")
-        out_file = temp_dir / "swatch.png"
-        result = run(
-            pal_tool, "export", testdata_pal_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        bit_depth = data[24]
-        assert bit_depth == 8
+        assert pal_swatch["bit_depth"] == 8
 
 
 class TestSwatchWithKnownPalette:
     """Test swatch with known palette values."""
 
+    @pytest.mark.skip(reason="Requires known palette test data")
     def test_temperat_pal_colors(self):
         """Test known colors from TEMPERAT.PAL."""
         # Common palette: index 0 = cyan (transparent marker in game)
         # Would need actual palette data to verify
-        pytest.skip("Requires known palette test data")
 
+    @pytest.mark.skip(reason="Requires known palette test data")
     def test_specific_color_positions(self):
         """Test specific colors appear at correct grid positions."""
-        pytest.skip("Requires known palette test data")
@@ -13,110 +13,100 @@ import pytest
 import struct
 from pathlib import Path
 
-
+U32_LE = struct.Struct("<I")
+FMT_PCM = struct.Struct("<HHIIHH")
+
+
+def parse_wav(data) -> dict:
+    """Decode the canonical PCM fmt fields and locate the data chunk.
+
+    data_offset is the position of the "data" tag (-1 if absent) and
+    data_size is its declared length (None if absent).
+    """
+    (format_code, channels, sample_rate, byte_rate, block_align,
+     bits) = FMT_PCM.unpack_from(data, 20)
+    data_offset = data.find(b"data")
+    data_size = None
+    if data_offset >= 0:
+        data_size = U32_LE.unpack_from(data, data_offset + 4)[0]
+    return {
+        "format_code": format_code,
+        "channels": channels,
+        "sample_rate": sample_rate,
+        "byte_rate": byte_rate,
+        "block_align": block_align,
+        "bits": bits,
+        "data_offset": data_offset,
+        "data_size": data_size,
+    }
+
+
+@pytest.fixture(scope="session")
+def wav_mmap(aud_tool, testdata_aud_files, tmp_path_factory, run,
+             mapped_file):
+    """Export the first testdata AUD to WAV once.
+
+    Yields a read-only mmap of the exported file.
+    """
+    if not testdata_aud_files:
+        pytest.skip("No AUD files in testdata")
+    out_file = tmp_path_factory.mktemp("wav") / "test.wav"
+    result = run(
+        aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
+    )
+    if result.returncode != 0:
+        pytest.skip("Export not implemented")
+    with mapped_file(out_file) as data:
+        yield data
+
+
+@pytest.fixture(scope="session")
+def wav_header(wav_mmap) -> dict:
+    """parse_wav() of the shared WAV export."""
+    return parse_wav(wav_mmap)
+
+
+@pytest.mark.xdist_group(name="wav_export")
 class TestWavHeader:
     """Test WAV file header structure."""
 
-    def test_riff_magic(self, aud_tool, testdata_aud_files, run, temp_dir):
-        """Test RIFF magic bytes."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        assert data[:4] == b"RIFF"
-
-    def test_wave_format(self, aud_tool, testdata_aud_files, run, temp_dir):
-        """Test WAVE format identifier."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        assert data[8:12] == b"WAVE"
-
-    def test_fmt_chunk(self, aud_tool, testdata_aud_files, run, temp_dir):
-        """Test fmt chunk presence and size."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        assert data[12:16] == b"fmt "
-        fmt_size = struct.unpack("<I", data[16:20])[0]
+    @pytest.mark.parametrize("offset,tag", [
+        pytest.param(0, b"RIFF", id="riff_magic"),
+        pytest.param(8, b"WAVE", id="wave_format"),
+        pytest.param(12, b"fmt ", id="fmt_chunk"),
+    ])
+    def test_header_tag(self, wav_mmap, offset, tag):
+        """Test RIFF magic, WAVE identifier and fmt chunk placement."""
+        assert wav_mmap[offset:offset + 4] == tag
+
+    def test_fmt_chunk_size(self, wav_mmap):
+        """Test fmt chunk size."""
+        fmt_size = U32_LE.unpack_from(wav_mmap, 16)[0]
         assert fmt_size >= 16  # Minimum for PCM
 
-    def test_data_chunk(self, aud_tool, testdata_aud_files, run, temp_dir):
+    def test_data_chunk(self, wav_header):
         """Test data chunk presence."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        # Find data chunk (may not be at fixed offset)
-        assert b"data" in data
+        # Found by search: the data chunk may not be at a fixed offset
+        assert wav_header["data_offset"] > 0
 
-    def test_file_size_field(self, aud_tool, testdata_aud_files, run, temp_dir):
+    def test_file_size_field(self, wav_mmap):
         """Test RIFF file size field accuracy."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        riff_size = struct.unpack("<I", data[4:8])[0]
+        data = wav_mmap
+        riff_size = U32_LE.unpack_from(data, 4)[0]
         assert riff_size == len(data) - 8
 
 
+@pytest.mark.xdist_group(name="wav_export")
 class TestWavPcmFormat:
     """Test PCM audio format."""
 
-    def test_format_code_pcm(self, aud_tool, testdata_aud_files, run, temp_dir):
+    def test_format_code_pcm(self, wav_header):
         """Test audio format code is 1 (PCM)."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        format_code = struct.unpack("<H", data[20:22])[0]
-        assert format_code == 1  # PCM
+        assert wav_header["format_code"] == 1  # PCM
 
-    def test_bits_per_sample(self, aud_tool, testdata_aud_files, run, temp_dir):
+    def test_bits_per_sample(self, wav_header):
         """Test 16-bit samples."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        bits = struct.unpack("<H", data[34:36])[0]
-        assert bits == 16
+        assert wav_header["bits"] == 16
 
     def test_signed_pcm_range(self):
         """Test 16-bit signed range (-32768 to 32767)."""
@@ -127,33 +117,16 @@ class TestWavPcmFormat:
         assert struct.unpack("<h", max_val)[0] == 32767
 
 
+@pytest.mark.xdist_group(name="wav_export")
 class TestWavSampleRate:
     """Test sample rate preservation."""
 
-    def test_sample_rate_preserved(
-        self, aud_tool, testdata_aud_files, run, temp_dir
-    ):
+    def test_sample_rate_preserved(self, aud_info, wav_header):
         """Test sample rate matches source AUD."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        # Get source sample rate
-        info_result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
-        source_rate = info.get("sample_rate") or info.get("SampleRate")
-
-        # Export and check WAV
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
+        source_rate = (
+            aud_info.get("sample_rate") or aud_info.get("SampleRate")
         )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        wav_rate = struct.unpack("<I", data[24:28])[0]
-        assert wav_rate == source_rate
+        assert wav_header["sample_rate"] == source_rate
 
     def test_common_sample_rates(self):
         """Test common Red Alert sample rates are valid."""
@@ -164,59 +137,30 @@ class TestWavSampleRate:
             assert rate <= 48000
 
 
+@pytest.mark.xdist_group(name="wav_export")
 class TestWavChannels:
     """Test channel preservation."""
 
-    def test_channel_count_preserved(
-        self, aud_tool, testdata_aud_files, run, temp_dir
-    ):
+    def test_channel_count_preserved(self, aud_info, wav_header):
         """Test channel count matches source AUD."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        # Get source channels
-        info_result = run(aud_tool, "info", "--json", testdata_aud_files[0])
-        if info_result.returncode != 0:
-            pytest.skip("Info not implemented")
-        import json
-        info = json.loads(info_result.stdout_text)
-        source_channels = info.get("channels") or info.get("Channels")
-
-        # Export and check WAV
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
+        source_channels = (
+            aud_info.get("channels") or aud_info.get("Channels")
         )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        wav_channels = struct.unpack("<H", data[22:24])[0]
-        assert wav_channels == source_channels
-
-    def test_mono_block_align(
-        self, aud_tool, testdata_aud_files, run, temp_dir
-    ):
+        assert wav_header["channels"] == source_channels
+
+    def test_mono_block_align(self, wav_header):
         """Test mono block alignment (2 bytes for 16-bit)."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        channels = struct.unpack("<H", data[22:24])[0]
-        block_align = struct.unpack("<H", data[32:34])[0]
-        assert block_align == channels * 2  # 2 bytes per sample
+        # 2 bytes per sample
+        assert wav_header["block_align"] == wav_header["channels"] * 2
 
     def test_stereo_interleaving(self):
         """Test stereo samples are interleaved (L, R, L, R, ...)."""
         # Create test stereo data
         left = [100, 200, 300]
         right = [-100, -200, -300]
-        interleaved = []
-        for l, r in zip(left, right):
-            interleaved.extend([l, r])
+        interleaved = [0] * (len(left) + len(right))
+        interleaved[0::2] = left
+        interleaved[1::2] = right
         assert interleaved == [100, -100, 200, -200, 300, -300]
 
 
@@ -238,59 +182,24 @@ class TestWavByteOrder:
         assert unpacked == sample
 
 
+@pytest.mark.xdist_group(name="wav_export")
 class TestWavDataIntegrity:
     """Test audio data integrity."""
 
-    def test_data_size_consistency(
-        self, aud_tool, testdata_aud_files, run, temp_dir
-    ):
+    def test_data_size_consistency(self, wav_mmap, wav_header):
         """Test data chunk size matches actual data."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
-        )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-        # Find data chunk offset
-        data_offset = data.find(b"data")
+        data_offset = wav_header["data_offset"]
         assert data_offset > 0
-        data_size = struct.unpack(
-            "<I", data[data_offset + 4:data_offset + 8]
-        )[0]
-        actual_size = len(data) - (data_offset + 8)
-        assert data_size == actual_size
-
-    def test_sample_count_matches_duration(
-        self, aud_tool, testdata_aud_files, run, temp_dir
-    ):
+        actual_size = len(wav_mmap) - (data_offset + 8)
+        assert wav_header["data_size"] == actual_size
+
+    def test_sample_count_matches_duration(self, wav_header):
         """Test sample count corresponds to duration."""
-        if not testdata_aud_files:
-            pytest.skip("No AUD files in testdata")
-        out_file = temp_dir / "test.wav"
-        result = run(
-            aud_tool, "export", testdata_aud_files[0], "-o", str(out_file)
+        assert wav_header["data_size"] is not None
+        bytes_per_sample = wav_header["bits"] // 8
+        total_samples = wav_header["data_size"] // (
+            bytes_per_sample * wav_header["channels"]
         )
-        if result.returncode != 0:
-            pytest.skip("Export not implemented")
-        data = out_file.read_bytes()
-
-        # Get parameters
-        sample_rate = struct.unpack("<I", data[24:28])[0]
-        channels = struct.unpack("<H", data[22:24])[0]
-        bits = struct.unpack("<H", data[34:36])[0]
-
-        # Find data chunk
-        data_offset = data.find(b"data")
-        data_size = struct.unpack(
-            "<I", data[data_offset + 4:data_offset + 8]
-        )[0]
-
-        # Calculate
-        bytes_per_sample = bits // 8
-        total_samples = data_size // (bytes_per_sample * channels)
-        duration = total_samples / sample_rate
+        duration = total_samples / wav_header["sample_rate"]
 
         assert duration > 0